@@ -14,7 +14,7 @@ from app.core.config import settings
 from app.core.database import Base
 
 # Import all models so Alembic can detect them
-import app.models
+import app.models._all  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -36,6 +36,20 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names):
+    """Reflect only the tables the models define during autogenerate.
+
+    Autogenerate otherwise inspects every table in the database (columns,
+    indexes, FKs, comments each a separate catalog query) just to compare it
+    against nothing. Tables are dropped with hand-written migrations here, so
+    nothing is lost by not proposing drops for unknown tables.
+    """
+    if type_ == "table":
+        return name in target_metadata.tables
+    return True
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -60,6 +74,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
         process_revision_directives=process_revision_directives,
     )
 
@@ -112,6 +127,7 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection, 
             target_metadata=target_metadata,
+            include_name=include_name,
             process_revision_directives=process_revision_directives,
         )
 
@@ -0,0 +1,51 @@
+"""composite (user_id, created_at) indexes on conversation_log
+
+Every conversation_log read is scoped to one user and ordered or ranged on
+created_at (transcript endpoint, daily memory consolidation, memory lookups).
+Two composites serve those as straight index range scans; the single-column
+user_id and conversation_id indexes become redundant and are dropped.
+
+Built CONCURRENTLY so the append-only table keeps taking writes.
+
+Revision ID: 20261017
+Revises: 20260803
+Create Date: 2026-10-17 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017'
+down_revision: Union[str, None] = '20260803'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversation_log_user_created', 'conversation_log',
+            ['user_id', 'created_at'], postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversation_log_user_conv_created', 'conversation_log',
+            ['user_id', 'conversation_id', 'created_at'], postgresql_concurrently=True,
+        )
+        op.drop_index('ix_conversation_log_user_id', 'conversation_log', postgresql_concurrently=True)
+        op.drop_index('ix_conversation_log_conversation_id', 'conversation_log', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_conversation_log_user_id', 'conversation_log', ['user_id'], postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_conversation_log_conversation_id', 'conversation_log', ['conversation_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_conversation_log_user_conv_created', 'conversation_log', postgresql_concurrently=True)
+        op.drop_index('ix_conversation_log_user_created', 'conversation_log', postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""store the remaining JSON columns as JSONB
+
+subscription_plans.features, user_subscriptions.subscription_metadata,
+payment_records.payment_metadata, journal_entries.metadata_json and
+journal_generation_log.emotional_context were created as text-based json.
+JSONB is stored pre-parsed (no re-parse on every read, smaller on disk) and
+matches conversation_log.meta.
+
+Revision ID: 20261017a
+Revises: 20261017
+Create Date: 2026-10-17 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017a'
+down_revision: Union[str, None] = '20261017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ("subscription_plans", "features"),
+    ("user_subscriptions", "subscription_metadata"),
+    ("payment_records", "payment_metadata"),
+    ("journal_entries", "metadata_json"),
+    ("journal_generation_log", "emotional_context"),
+]
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE jsonb USING {column}::jsonb")
+
+
+def downgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE json USING {column}::json")
@@ -0,0 +1,46 @@
+"""check constraints for trait bounds on clara_state and clara_global_state
+
+Both tables carry min_value/max_value next to numeric_value, but the bounds
+were only honoured by the state manager's clamp. A CHECK makes an
+out-of-range write fail in the database, whichever code path issued it.
+
+Added NOT VALID and validated separately, like 20261017e: VALIDATE CONSTRAINT
+scans the table without the ACCESS EXCLUSIVE lock a plain ADD CONSTRAINT holds.
+
+Revision ID: 20261017b
+Revises: 20261017a
+Create Date: 2026-10-17 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017b'
+down_revision: Union[str, None] = '20261017a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BOUNDS_CHECK = (
+    "numeric_value IS NULL OR ("
+    "(min_value IS NULL OR numeric_value >= min_value) AND "
+    "(max_value IS NULL OR numeric_value <= max_value))"
+)
+
+
+def upgrade() -> None:
+    tables = ("clara_state", "clara_global_state")
+    for table in tables:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT ck_{table}_numeric_value_in_bounds "
+            f"CHECK ({BOUNDS_CHECK}) NOT VALID"
+        )
+    for table in tables:
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT ck_{table}_numeric_value_in_bounds")
+
+
+def downgrade() -> None:
+    for table in ("clara_global_state", "clara_state"):
+        op.drop_constraint(f"ck_{table}_numeric_value_in_bounds", table, type_="check")
@@ -0,0 +1,61 @@
+"""hash indexes for lookup-only Stripe IDs
+
+user_subscriptions.stripe_customer_id carried two identical B-tree indexes
+(one from index=True, one named in __table_args__), and
+payment_records.stripe_charge_id a B-tree of its own. Both are opaque IDs
+only ever compared with =, so each gets a single hash index instead.
+
+The unique Stripe IDs (price, subscription, payment intent, invoice) keep
+their unique B-trees: Postgres hash indexes cannot enforce uniqueness, and
+those constraints are what make webhook retries idempotent.
+
+Revision ID: 20261017c
+Revises: 20261017b
+Create Date: 2026-10-17 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017c'
+down_revision: Union[str, None] = '20261017b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_subscriptions_stripe_customer_hash', 'user_subscriptions', ['stripe_customer_id'],
+            postgresql_using='hash', postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_payment_records_stripe_charge_hash', 'payment_records', ['stripe_charge_id'],
+            postgresql_using='hash', postgresql_concurrently=True,
+        )
+        op.drop_index('ix_user_subscriptions_stripe_customer', 'user_subscriptions', postgresql_concurrently=True)
+        op.drop_index('ix_user_subscriptions_stripe_customer_id', 'user_subscriptions', postgresql_concurrently=True)
+        op.drop_index('ix_payment_records_stripe_charge_id', 'payment_records', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_payment_records_stripe_charge_id', 'payment_records', ['stripe_charge_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_subscriptions_stripe_customer_id', 'user_subscriptions', ['stripe_customer_id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_user_subscriptions_stripe_customer', 'user_subscriptions', ['stripe_customer_id'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_payment_records_stripe_charge_hash', 'payment_records', postgresql_concurrently=True)
+        op.drop_index(
+            'ix_user_subscriptions_stripe_customer_hash', 'user_subscriptions', postgresql_concurrently=True
+        )
@@ -0,0 +1,58 @@
+"""drop the redundant indexes on primary key columns
+
+Models declared primary_key=True together with index=True, so every table
+got a plain ix_<table>_<pk> B-tree alongside the index backing its primary
+key. Nothing queries through the named copy; it only costs a second index
+write on every insert.
+
+clara_state and clara_global_state were created outside migrations and may
+carry either the ava_* or clara_* index names, hence IF EXISTS.
+
+Revision ID: 20261017d
+Revises: 20261017c
+Create Date: 2026-10-17 05:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017d'
+down_revision: Union[str, None] = '20261017c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, primary key column)
+PK_COLUMNS = [
+    ("users", "id"),
+    ("subscription_plans", "id"),
+    ("user_subscriptions", "id"),
+    ("payment_records", "id"),
+    ("clara_state", "state_id"),
+    ("clara_global_state", "state_id"),
+    ("global_events", "event_id"),
+    ("simulation_log", "log_id"),
+    ("simulation_config", "config_id"),
+    ("journal_entries", "entry_id"),
+    ("journal_generation_log", "log_id"),
+    ("journal_templates", "template_id"),
+    ("conversation_log", "id"),
+]
+
+LEGACY_INDEX_NAMES = ["ix_ava_state_state_id", "ix_ava_global_state_state_id"]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in PK_COLUMNS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_{column}")
+        for name in LEGACY_INDEX_NAMES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in PK_COLUMNS:
+            op.create_index(f"ix_{table}_{column}", table, [column], postgresql_concurrently=True)
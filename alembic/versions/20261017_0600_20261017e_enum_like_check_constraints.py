@@ -0,0 +1,56 @@
+"""CHECK constraints on enum-like string columns
+
+Subscription and payment statuses, payment_type, trait trends and the
+conversation_log role were free-form VARCHARs, validated nowhere. Each gets a
+CHECK IN (...) instead of a native enum, so adding a value (Stripe grows its
+status list now and then) is a constraint swap, not ALTER TYPE.
+
+Added NOT VALID and validated separately: VALIDATE CONSTRAINT scans the
+table without blocking writes, which matters for conversation_log.
+
+Revision ID: 20261017e
+Revises: 20261017d
+Create Date: 2026-10-17 06:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017e'
+down_revision: Union[str, None] = '20261017d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TREND_CHECK = "trend IN ('increasing', 'decreasing', 'stable')"
+
+# (table, constraint name, condition)
+CHECKS = [
+    (
+        "user_subscriptions", "ck_user_subscriptions_status",
+        "status IN ('inactive', 'active', 'trialing', 'past_due', 'canceled', 'unpaid', "
+        "'incomplete', 'incomplete_expired', 'paused')",
+    ),
+    (
+        "payment_records", "ck_payment_records_status",
+        "status IN ('pending', 'succeeded', 'failed', 'canceled', 'refunded')",
+    ),
+    ("payment_records", "ck_payment_records_payment_type", "payment_type IN ('subscription', 'one_time')"),
+    ("clara_state", "ck_clara_state_trend", TREND_CHECK),
+    ("clara_global_state", "ck_clara_global_state_trend", TREND_CHECK),
+    ("conversation_log", "ck_conversation_log_role", "role IN ('user', 'assistant', 'memory')"),
+]
+
+
+def upgrade() -> None:
+    for table, name, condition in CHECKS:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+    for table, name, _ in CHECKS:
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for table, name, _ in reversed(CHECKS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,38 @@
+"""partial index for the unprocessed global_events queue
+
+The event processor, the repository and the statistics endpoint all filter
+global_events on status = 'unprocessed' and read oldest first. The
+single-column status index covered that poorly: nearly every row is
+'processed', and the timestamp order still needed a sort. A partial index
+on timestamp over just the unprocessed rows replaces it.
+
+Revision ID: 20261017f
+Revises: 20261017e
+Create Date: 2026-10-17 07:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017f'
+down_revision: Union[str, None] = '20261017e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_global_events_unprocessed_timestamp', 'global_events', ['timestamp'],
+            postgresql_where=sa.text("status = 'unprocessed'"), postgresql_concurrently=True,
+        )
+        op.drop_index('ix_global_events_status', 'global_events', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_global_events_status', 'global_events', ['status'], postgresql_concurrently=True)
+        op.drop_index('ix_global_events_unprocessed_timestamp', 'global_events', postgresql_concurrently=True)
@@ -0,0 +1,50 @@
+"""CHECK constraints on global_events and journal status columns
+
+Same treatment as 20261017e for the remaining enum-like columns: the
+global_events category, status and impact columns, and the journal entry and
+generation-log statuses. They keep their VARCHAR(n) width and get a CHECK
+IN (...) rather than a native enum type.
+
+Revision ID: 20261017g
+Revises: 20261017f
+Create Date: 2026-10-17 08:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017g'
+down_revision: Union[str, None] = '20261017f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+IMPACT_LEVELS = "('increase', 'decrease', 'neutral')"
+
+# (table, constraint name, condition)
+CHECKS = [
+    ("global_events", "ck_global_events_event_type", "event_type IN ('work', 'social', 'personal')"),
+    ("global_events", "ck_global_events_status", "status IN ('unprocessed', 'processed')"),
+    ("global_events", "ck_global_events_impact_mood", "impact_mood IN ('positive', 'negative', 'neutral')"),
+    ("global_events", "ck_global_events_impact_energy", f"impact_energy IN {IMPACT_LEVELS}"),
+    ("global_events", "ck_global_events_impact_stress", f"impact_stress IN {IMPACT_LEVELS}"),
+    ("journal_entries", "ck_journal_entries_status", "status IN ('draft', 'approved', 'posted')"),
+    (
+        "journal_generation_log", "ck_journal_generation_log_status",
+        "status IN ('success', 'failure', 'no_events', 'skipped')",
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, name, condition in CHECKS:
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {name} CHECK ({condition}) NOT VALID")
+    for table, name, _ in CHECKS:
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def downgrade() -> None:
+    for table, name, _ in reversed(CHECKS):
+        op.drop_constraint(name, table, type_="check")
@@ -0,0 +1,31 @@
+"""Server-side defaults for global_events status and created_by
+
+Neither column is ever set by the code that creates events, so the defaults
+now live in the table instead of being bound into every INSERT. Both create
+paths refresh the row after commit, which reads the filled-in values back.
+
+Revision ID: 20261017h
+Revises: 20261017g
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '20261017h'
+down_revision: Union[str, None] = '20261017g'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column("global_events", "status", server_default=sa.text("'unprocessed'"))
+    op.alter_column("global_events", "created_by", server_default=sa.text("'simulation_engine'"))
+
+
+def downgrade() -> None:
+    op.alter_column("global_events", "created_by", server_default=None)
+    op.alter_column("global_events", "status", server_default=None)
@@ -17,12 +17,14 @@ from app.core.auth import get_current_admin_user
 from app.models.journal import JournalEntries, JournalGenerationLog, JournalTemplate
 from app.schemas.journal_schemas import (
     JournalEntryResponse,
+    JournalEntryListAdapter,
     JournalEntryListResponse,
     JournalEntryUpdate,
     JournalGenerationRequest,
     JournalGenerationResponse,
     JournalStatsResponse,
     DailyContextResponse,
+    GenerationLogListAdapter,
     GenerationLogResponse,
     JournalTemplateResponse,
     JournalTemplateCreate,
@@ -77,7 +79,7 @@ async def list_journal_entries(
         entries = result.scalars().all()
 
         return JournalEntryListResponse(
-            entries=[JournalEntryResponse.from_orm(entry) for entry in entries],
+            entries=JournalEntryListAdapter.validate_python(entries, from_attributes=True),
             total=total,
             page=page,
             size=size,
@@ -112,7 +114,7 @@ async def get_journal_entry(
                 detail="Journal entry not found"
             )
 
-        return JournalEntryResponse.from_orm(entry)
+        return JournalEntryResponse.model_validate(entry)
 
     except HTTPException:
         raise
@@ -179,7 +181,7 @@ async def update_journal_entry(
 
         logger.info(f"Journal entry {entry_id} updated by {current_user.get('email', 'unknown')}")
 
-        return JournalEntryResponse.from_orm(updated_entry)
+        return JournalEntryResponse.model_validate(updated_entry)
 
     except HTTPException:
         raise
@@ -419,7 +421,7 @@ async def get_generation_logs(
         result = await session.execute(query)
         logs = result.scalars().all()
 
-        return [GenerationLogResponse.from_orm(log) for log in logs]
+        return GenerationLogListAdapter.validate_python(logs, from_attributes=True)
 
     except Exception as e:
         logger.error(f"Error getting generation logs: {e}")
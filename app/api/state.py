@@ -12,6 +12,7 @@ from fastapi.security import HTTPBearer
 from pydantic import BaseModel, Field
 
 from app.core.auth import verify_token, get_current_user
+from app.core.database import get_pool_status
 from app.services.simulation.state_manager import StateManagerService
 from app.services.session_state_service import SessionStateService
 from app.services.state_influence_service import StateInfluenceService, ConversationScenario
@@ -456,6 +457,7 @@ async def state_system_health_check(
         health_data = {
             "redis": redis_health,
             "state_manager": state_manager_health,
+            "db_pool": get_pool_status(),
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
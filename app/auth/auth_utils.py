@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 import jwt
 import httpx
 from fastapi import HTTPException, status
@@ -26,6 +27,11 @@ class AuthUtils:
         self.audience = settings.auth0_audience
         self.issuer = settings.auth0_issuer
         self.jwks_cache = None
+        # kid -> key object parsed from the JWK, so the JWK -> RSA public key
+        # conversion happens once per key instead of on every verification
+        self._signing_keys: Dict[str, Any] = {}
+        # In-flight JWKS fetch shared by every caller that misses the cache
+        self._jwks_inflight: Optional[asyncio.Future] = None
         
         # Validate required environment variables
         if not all([self.auth0_domain, self.audience, self.issuer]):
@@ -35,13 +41,27 @@ class AuthUtils:
     async def _get_jwks(self) -> Dict:
         """
         Get the JSON Web Key Set from Auth0 with caching.
+
+        Concurrent cache misses share a single fetch: the first caller starts
+        it and the rest await the same future instead of each hitting Auth0.
         
         Returns:
             Dict: The JWKS response
         """
         if self.jwks_cache:
             return self.jwks_cache
-            
+
+        if self._jwks_inflight is None:
+            self._jwks_inflight = asyncio.ensure_future(self._fetch_jwks())
+            self._jwks_inflight.add_done_callback(self._clear_jwks_inflight)
+        # shield: a cancelled waiter must not cancel the fetch for the others
+        return await asyncio.shield(self._jwks_inflight)
+
+    def _clear_jwks_inflight(self, future: asyncio.Future) -> None:
+        if self._jwks_inflight is future:
+            self._jwks_inflight = None
+
+    async def _fetch_jwks(self) -> Dict:
         try:
             async with httpx.AsyncClient(timeout=10.0) as client:
                 response = await client.get(f"https://{self.auth0_domain}/.well-known/jwks.json")
@@ -55,7 +75,7 @@ class AuthUtils:
                 detail="Failed to get authentication keys"
             )
     
-    def _get_signing_key(self, kid: str, jwks: Dict) -> str:
+    def _get_signing_key(self, kid: str, jwks: Dict) -> Any:
         """
         Get the RSA signing key from JWKS that matches the kid.
         
@@ -64,12 +84,18 @@ class AuthUtils:
             jwks: JSON Web Key Set
             
         Returns:
-            str: The RSA public key for verification
+            The cryptography RSA public key for verification
         """
+        signing_key = self._signing_keys.get(kid)
+        if signing_key is not None:
+            return signing_key
+
         for key in jwks.get("keys", []):
             if key.get("kid") == kid:
                 try:
-                    return jwt.algorithms.RSAAlgorithm.from_jwk(key)
+                    signing_key = jwt.algorithms.RSAAlgorithm.from_jwk(key)
+                    self._signing_keys[kid] = signing_key
+                    return signing_key
                 except (jwt.PyJWTError, ValueError, KeyError) as e:
                     logger.error(f"Failed to construct RSA key: {str(e)}")
                     raise HTTPException(
@@ -3,6 +3,7 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.auth.auth_utils import AuthUtils, security
 from app.core.config import settings
@@ -81,8 +82,22 @@ async def get_current_user(
             is_anonymous=False
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        try:
+            db.commit()
+        except IntegrityError as e:
+            # A concurrent first request for the same login inserted the row
+            # between our SELECT and INSERT; the unique auth0_sub index is the
+            # source of truth, so use that row instead of failing the request
+            db.rollback()
+            user = db.execute(select(User).where(User.auth0_sub == auth0_sub)).scalar_one_or_none()
+            if user is None:
+                # No such row: the conflict was the unique email, held by another account
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Email is already linked to another account"
+                ) from e
+        else:
+            db.refresh(user)
     else:
         # Update user information if it has changed
         updated = False
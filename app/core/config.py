@@ -1,6 +1,6 @@
 import os
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     # OpenAI Configuration
@@ -40,6 +40,8 @@ class Settings(BaseSettings):
     db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
     db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
     db_pool_timeout: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Recycle connections before server/pooler idle timeouts silently drop them
+    db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
     
     # Stripe Configuration
     stripe_secret_key: str = os.getenv("STRIPE_SECRET_KEY", "")
@@ -64,12 +66,13 @@ class Settings(BaseSettings):
     def is_production(self) -> bool:
         return self.environment == "production"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False,
         # ponytail: .env carries vars read via os.getenv (e.g. CLARA_DEBUG_PROMPT) that
         # aren't Settings fields; forbidding them crashes any process started with env_file.
-        extra = "ignore"
+        extra="ignore",
+    )
 
 settings = Settings()
 
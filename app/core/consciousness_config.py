@@ -88,6 +88,7 @@ class PerformanceConfig:
     max_total_response_time_ms: float = 5000.0  # 5 seconds max total response time
     enable_performance_logging: bool = True
     enable_fallback_on_timeout: bool = True
+    rate_limit_retries: int = 2  # Jittered retries on 429 within the call's timeout
 
     # Metrics collection
     collect_success_failure_metrics: bool = True
@@ -168,6 +169,7 @@ class ConsciousnessConfig:
             max_total_response_time_ms=self._get_float_env("CONSCIOUSNESS_MAX_TOTAL_TIME_MS", 5000.0),
             enable_performance_logging=self._get_bool_env("CONSCIOUSNESS_PERF_LOGGING", True),
             enable_fallback_on_timeout=self._get_bool_env("CONSCIOUSNESS_FALLBACK_ON_TIMEOUT", True),
+            rate_limit_retries=self._get_int_env("CONSCIOUSNESS_RATE_LIMIT_RETRIES", 2),
             collect_success_failure_metrics=self._get_bool_env("CONSCIOUSNESS_COLLECT_METRICS", True),
             metrics_retention_hours=self._get_int_env("CONSCIOUSNESS_METRICS_RETENTION_HOURS", 24)
         )
@@ -289,6 +291,12 @@ class ConsciousnessConfig:
                 "Total response time limit is very low (<1s), may impact quality"
             )
 
+        if self.performance.rate_limit_retries < 0:
+            validation_results["errors"].append(
+                "Rate-limit retry count is negative; consciousness calls would never be made"
+            )
+            validation_results["valid"] = False
+
         # Validate Chain-of-Thought configuration
         if self.chain_of_thought.enabled and self.chain_of_thought.steps_count < 3:
             validation_results["warnings"].append(
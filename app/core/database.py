@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import hashlib
 import logging
 
 from app.core.config import settings
@@ -29,6 +30,7 @@ def create_database_engine():
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
             pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
             pool_pre_ping=True,  # Verify connections before use
             echo=settings.debug,  # Log SQL queries in debug mode
         )
@@ -65,6 +67,7 @@ def create_async_database_engine():
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
             pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
             pool_pre_ping=True,
             echo=settings.debug,
         )
@@ -130,30 +133,103 @@ def check_connection():
         return False
 
 
-def _sqlite_table_has_column(connection, table_name: str, column_name: str) -> bool:
+def get_pool_status() -> dict:
+    """Connection pool occupancy for both engines, for health/metrics reporting."""
+    return {
+        "sync": engine.pool.status(),
+        "async": async_engine.pool.status(),
+    }
+
+
+# Columns added after their table was first created; create_all() never alters
+# existing tables, so dev SQLite databases need these patched in by hand.
+_DEV_SQLITE_COLUMNS = {
+    "users": (("anon_uuid", "VARCHAR"),),
+}
+
+
+def _sqlite_table_columns(connection, table_name: str) -> set:
+    """Column names of a SQLite table (empty if the table does not exist)."""
     try:
         result = connection.execute(text(f"PRAGMA table_info({table_name})"))
-        for row in result:
-            # PRAGMA table_info columns: cid, name, type, notnull, dflt_value, pk
-            if str(row[1]) == column_name:
-                return True
-        return False
+        # PRAGMA table_info columns: cid, name, type, notnull, dflt_value, pk
+        return {str(row[1]) for row in result}
     except Exception:
-        return False
+        return set()
 
 
 def ensure_dev_sqlite_columns():
     """Best-effort: ensure new columns exist in dev SQLite.
 
-    This is only for local dev convenience. For production, use Alembic.
+    Reads each table's columns once and issues only the missing ALTERs, all
+    inside a single write transaction. This is only for local dev convenience.
+    For production, use Alembic.
     """
     try:
         if not settings.database_url.startswith('sqlite'):
             return
+        added = []
+        with engine.begin() as connection:
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+            for table_name, columns in _DEV_SQLITE_COLUMNS.items():
+                existing = _sqlite_table_columns(connection, table_name)
+                if not existing:
+                    continue
+                for column_name, column_type in columns:
+                    if column_name not in existing:
+                        connection.execute(text(
+                            f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
+                        ))
+                        added.append(f"{table_name}.{column_name}")
+        logger.info(f"Ensured dev SQLite columns exist (added: {', '.join(added) or 'none'})")
+    except Exception as e:
+        logger.warning(f"Could not ensure dev SQLite columns: {e}")
+
+
+def _dev_schema_fingerprint() -> str:
+    """Hash of the tables and patched columns the dev bootstrap is expected to produce."""
+    parts = sorted(Base.metadata.tables)
+    parts += [
+        f"{table_name}.{column_name}"
+        for table_name, columns in sorted(_DEV_SQLITE_COLUMNS.items())
+        for column_name, _ in columns
+    ]
+    return hashlib.sha1("|".join(parts).encode()).hexdigest()
+
+
+def bootstrap_dev_schema():
+    """Dev-only schema bootstrap: create_tables() plus the SQLite column patches.
+
+    On SQLite the schema fingerprint is stored in a small ``_meta`` table, so warm
+    restarts against an unchanged schema skip create_all and all introspection.
+    """
+    is_sqlite = settings.database_url.startswith('sqlite')
+    fingerprint = _dev_schema_fingerprint()
+    if is_sqlite:
+        try:
+            with engine.connect() as connection:
+                stored = connection.execute(
+                    text("SELECT value FROM _meta WHERE key = 'schema_fp'")
+                ).scalar()
+            if stored == fingerprint:
+                logger.info("Dev SQLite schema unchanged, skipping bootstrap")
+                return
+        except Exception:
+            # No _meta table yet: first boot against this database
+            pass
+
+    create_tables()
+    if not is_sqlite:
+        return
+    ensure_dev_sqlite_columns()
+    try:
         with engine.begin() as connection:
-            # users.anon_uuid
-            if not _sqlite_table_has_column(connection, 'users', 'anon_uuid'):
-                connection.execute(text("ALTER TABLE users ADD COLUMN anon_uuid VARCHAR"))
-            logger.info("Ensured dev SQLite columns exist (anon_uuid)")
+            connection.execute(text(
+                "CREATE TABLE IF NOT EXISTS _meta (key VARCHAR PRIMARY KEY, value VARCHAR)"
+            ))
+            connection.execute(
+                text("INSERT OR REPLACE INTO _meta (key, value) VALUES ('schema_fp', :fp)"),
+                {"fp": fingerprint},
+            )
     except Exception as e:
-        logger.warning(f"Could not ensure dev SQLite columns: {e}")
\ No newline at end of file
+        logger.warning(f"Could not record dev SQLite schema fingerprint: {e}")
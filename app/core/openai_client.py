@@ -0,0 +1,54 @@
+"""
+Connection pool shared by the AsyncOpenAI clients.
+
+Services are built per request, and each fresh AsyncOpenAI used to bring its
+own httpx pool, so every conversation turn paid a new TCP + TLS handshake to
+the API. Clients built with ``http_client=shared_http_client()`` reuse warm
+connections instead.
+
+There is one pool per event loop: Celery tasks each run their own loop
+(asyncio.run), and a pooled connection cannot be used from another loop. Such
+tasks wrap their work in ``closing_shared_http_client()`` so the pool is closed
+before the loop is; the app's own pool is closed at shutdown.
+"""
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import httpx
+from openai import DefaultAsyncHttpxClient
+
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def shared_http_client() -> Optional[httpx.AsyncClient]:
+    """The running loop's pool, or None outside a loop (AsyncOpenAI then builds its own)."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        # OpenAI's own defaults: timeouts, connection limits, redirects
+        client = _http_clients[loop] = DefaultAsyncHttpxClient()
+    return client
+
+
+async def aclose_shared_http_client() -> None:
+    """Close the running loop's pool; for app shutdown."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def closing_shared_http_client() -> AsyncIterator[None]:
+    """Close the running loop's pool on exit; for tasks that own their loop."""
+    try:
+        yield
+    finally:
+        await aclose_shared_http_client()
@@ -1,12 +1,14 @@
 import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import os
 from app.api import clara, subscriptions, state
 from app.api.simulation import admin as simulation_admin
 from app.api.admin import journal as admin_journal
 from app.core.config import settings
-from app.middleware.subscription_middleware import SubscriptionMiddleware
+from app.middleware.subscription_middleware import handle_subscription_error
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 app = FastAPI(
     title="Clara API",
@@ -14,6 +16,7 @@ app = FastAPI(
     docs_url=None if settings.is_production else "/docs",
     redoc_url=None if settings.is_production else "/redoc",
     openapi_url=None if settings.is_production else "/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -29,22 +32,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add subscription middleware for handling subscription-required responses
-app.add_middleware(SubscriptionMiddleware)
-
-# Include routers
-app.include_router(clara.router, prefix="/api/clara", tags=["clara"])
-app.include_router(subscriptions.router, prefix="/api", tags=["subscriptions"])
-
-# Simulation engine admin routes
-app.include_router(simulation_admin.router, prefix="/api/simulation", tags=["simulation"])
-
-# Admin journal routes
-app.include_router(admin_journal.router, prefix="/api", tags=["admin"])
-
+# Format subscription-required (402) responses raised by the subscription guard
+app.add_exception_handler(StarletteHTTPException, handle_subscription_error)
+
+# Routers as (router, prefix, tags)
+ROUTERS = (
+    (clara.router, "/api/clara", ["clara"]),
+    (subscriptions.router, "/api", ["subscriptions"]),
+    # Simulation engine admin routes
+    (simulation_admin.router, "/api/simulation", ["simulation"]),
+    # Admin journal routes
+    (admin_journal.router, "/api", ["admin"]),
+    # State management routes
+    (state.router, "", ["state"]),
+)
 
-# State management routes
-app.include_router(state.router, tags=["state"])
+for router, prefix, tags in ROUTERS:
+    app.include_router(router, prefix=prefix, tags=tags)
 
 
 @app.get("/")
@@ -63,17 +67,20 @@ async def startup_event():
     logger.info("Initializing Clara backend services...")
     
     # Import models to ensure they're registered with Base
-    from app.models import user, clara_state
-    # Models imported for SQLAlchemy registration
+    from app.models import _all  # noqa: F401
+    from app.core.database import Base
+
+    # Resolve string relationship targets now rather than on the first query
+    # each worker serves; a bad target fails the boot instead of a request
+    Base.registry.configure()
     
     # Initialize database tables
-    from app.core.database import create_tables, check_connection, ensure_dev_sqlite_columns
+    from app.core.database import bootstrap_dev_schema, check_connection
     if check_connection():
         # In production, rely on Alembic migrations
         if settings.is_development:
-            create_tables()
-            # Dev convenience: add columns for SQLite if missing
-            ensure_dev_sqlite_columns()
+            # Dev convenience: create tables and add SQLite columns if missing
+            bootstrap_dev_schema()
         logger.info("Database tables initialized")
     else:
         logger.error("Database connection failed")
@@ -91,5 +98,7 @@ async def shutdown_event():
     logger = logging.getLogger("app.shutdown")
     logger.info("Shutting down Clara backend services...")
     
-    # Cleanup would go here if needed
+    from app.core.openai_client import aclose_shared_http_client
+    await aclose_shared_http_client()
+
     logger.info("Clara backend shutdown complete")
\ No newline at end of file
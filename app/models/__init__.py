@@ -1,23 +1,52 @@
-# Import all models here so Alembic can detect them
-from .user import User
-from .clara_state import ClaraState
-from .subscription import SubscriptionPlan, UserSubscription, PaymentRecord
-from .simulation import GlobalEvents, ClaraGlobalState, SimulationLog, SimulationConfig
-from .journal import JournalEntries, JournalGenerationLog, JournalTemplate
-from .conversation_log import ConversationLog
-
-__all__ = [
-    "User",
-    "ClaraState",
-    "SubscriptionPlan",
-    "UserSubscription",
-    "PaymentRecord",
-    "GlobalEvents",
-    "ClaraGlobalState",
-    "SimulationLog",
-    "SimulationConfig",
-    "JournalEntries",
-    "JournalGenerationLog",
-    "JournalTemplate",
-    "ConversationLog"
-]
+"""ORM models, resolved lazily on first attribute access (PEP 562).
+
+Importing the package or one model module defers loading the others, but only
+until mappers are configured: relationships name their targets as strings, so
+a ``before_configured`` hook imports ``app.models._all`` then. Startup calls
+``Base.registry.configure()`` and any first query configures too, so every
+process still has all mappers loaded before it touches the database; the lazy
+map only keeps bare imports (scripts, tests, tooling) cheap. Code that needs
+the full metadata up front, such as Alembic or ``create_all``, imports
+``app.models._all`` directly.
+"""
+import importlib
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper
+
+_LAZY = {
+    "User": "app.models.user",
+    "ClaraState": "app.models.clara_state",
+    "SubscriptionPlan": "app.models.subscription",
+    "UserSubscription": "app.models.subscription",
+    "PaymentRecord": "app.models.subscription",
+    "GlobalEvents": "app.models.simulation",
+    "ClaraGlobalState": "app.models.simulation",
+    "SimulationLog": "app.models.simulation",
+    "SimulationConfig": "app.models.simulation",
+    "JournalEntries": "app.models.journal",
+    "JournalGenerationLog": "app.models.journal",
+    "JournalTemplate": "app.models.journal",
+    "ConversationLog": "app.models.conversation_log",
+}
+
+__all__ = list(_LAZY)
+
+
+@event.listens_for(Mapper, "before_configured", once=True)
+def _register_all_models():
+    importlib.import_module("app.models._all")
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
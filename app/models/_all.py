@@ -0,0 +1,12 @@
+"""Import every model module so all mappers are registered on ``Base.metadata``.
+
+Used by Alembic's env.py and the dev ``create_all`` bootstrap.
+"""
+from app.models import (  # noqa: F401
+    clara_state,
+    conversation_log,
+    journal,
+    simulation,
+    subscription,
+    user,
+)
@@ -0,0 +1,14 @@
+"""Column mixins shared by the declarative models."""
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+
+class TimestampMixin:
+    """``created_at`` set by the database on insert, ``updated_at`` on every ORM update."""
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, DateTime, Float, Text
+from sqlalchemy import CheckConstraint, Integer, String, DateTime, Float, Text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional
@@ -14,8 +14,20 @@ class ClaraState(Base):
     Enhanced with numeric values, trend tracking, and change metadata.
     """
     __tablename__ = "clara_state"
+    __table_args__ = (
+        # Bounds are enforced by the database, so no write path can skip them
+        CheckConstraint(
+            "numeric_value IS NULL OR ("
+            "(min_value IS NULL OR numeric_value >= min_value) AND "
+            "(max_value IS NULL OR numeric_value <= max_value))",
+            name="ck_clara_state_numeric_value_in_bounds",
+        ),
+        CheckConstraint(
+            "trend IN ('increasing', 'decreasing', 'stable')", name="ck_clara_state_trend"
+        ),
+    )
 
-    state_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    state_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     trait_name: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     value: Mapped[str] = mapped_column(String, nullable=False)
 
@@ -6,7 +6,7 @@ ephemeral. This table is the permanent record: one row per user/assistant
 message, never updated, never deleted.
 """
 
-from sqlalchemy import Integer, String, Text, DateTime, JSON, LargeBinary, cast
+from sqlalchemy import Integer, String, Text, DateTime, JSON, LargeBinary, Index, CheckConstraint, cast
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
@@ -50,17 +50,28 @@ class ConversationLog(Base):
     """One conversation turn (user utterance or Clara reply)."""
 
     __tablename__ = "conversation_log"
+    # Every read is scoped to one user and walks created_at: the transcript
+    # endpoint (optionally per conversation), the daily consolidation window and
+    # the memory lookups. These composites serve them as index range scans with
+    # no sort; their leading user_id replaces the old single-column indexes.
+    __table_args__ = (
+        Index("ix_conversation_log_user_created", "user_id", "created_at"),
+        Index("ix_conversation_log_user_conv_created", "user_id", "conversation_id", "created_at"),
+        CheckConstraint("role IN ('user', 'assistant', 'memory')", name="ck_conversation_log_role"),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
-    conversation_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    conversation_id: Mapped[str] = mapped_column(String, nullable=False)
     role: Mapped[str] = mapped_column(String(20), nullable=False)  # "user" | "assistant" | "memory"
     content: Mapped[str] = mapped_column(Text, nullable=False)
     # Nullable: an un-embedded row is simply one only the keyword path can find.
     # ponytail: LargeBinary on sqlite so tests can create_all — the vector path is
     # postgres-only and never touches the column under sqlite.
+    # Deferred: ~6KB per row that only the raw-SQL vector search reads, so ORM
+    # selects (transcript, consolidation, keyword search) leave it out.
     embedding: Mapped[Optional[List[float]]] = mapped_column(
-        Vector(768).with_variant(LargeBinary(), "sqlite"), nullable=True
+        Vector(768).with_variant(LargeBinary(), "sqlite"), nullable=True, deferred=True
     )
     # ponytail: JSONB on postgres, plain JSON on sqlite so tests can create_all
     meta: Mapped[Optional[Dict[str, Any]]] = mapped_column(
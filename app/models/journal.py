@@ -3,7 +3,8 @@ Database models for the Daily Journal Generator.
 Handles journal entries storage and management.
 """
 
-from sqlalchemy import Integer, String, DateTime, Text, Date, JSON, Boolean
+from sqlalchemy import CheckConstraint, Integer, String, DateTime, Text, Date, JSON, Boolean
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 from typing import Optional, Dict, Any
@@ -17,12 +18,16 @@ class JournalEntries(Base):
     Stores Clara's daily reflections for social media content.
     """
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('draft', 'approved', 'posted')", name="ck_journal_entries_status"
+        ),
+    )
 
     entry_id: Mapped[str] = mapped_column(
         String,
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
-        index=True,
         comment="Unique identifier for the journal entry"
     )
 
@@ -114,7 +119,7 @@ class JournalEntries(Base):
 
     # JSON field for flexible metadata
     metadata_json: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB().with_variant(JSON(), "sqlite"),
         comment="Additional metadata (source events, generation params, etc.)"
     )
 
@@ -128,8 +133,14 @@ class JournalGenerationLog(Base):
     Tracks generation success/failure and debugging information.
     """
     __tablename__ = "journal_generation_log"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('success', 'failure', 'no_events', 'skipped')",
+            name="ck_journal_generation_log_status",
+        ),
+    )
 
-    log_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    log_id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     target_date: Mapped[Date] = mapped_column(
         Date,
@@ -180,7 +191,7 @@ class JournalGenerationLog(Base):
 
     # Generation context
     emotional_context: Mapped[Optional[Dict[str, Any]]] = mapped_column(
-        JSON,
+        JSONB().with_variant(JSON(), "sqlite"),
         comment="Emotional state and context at time of generation"
     )
 
@@ -207,7 +218,7 @@ class JournalTemplate(Base):
     """
     __tablename__ = "journal_templates"
 
-    template_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    template_id: Mapped[int] = mapped_column(Integer, primary_key=True)
 
     name: Mapped[str] = mapped_column(
         String(100),
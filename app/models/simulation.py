@@ -3,7 +3,7 @@ Database models for the simulation engine.
 Handles GlobalEvents and ClaraGlobalState for the "Day in the Life" simulation.
 """
 
-from sqlalchemy import Integer, String, DateTime, Text, Boolean
+from sqlalchemy import CheckConstraint, Index, Integer, String, DateTime, Text, Boolean, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
@@ -18,12 +18,37 @@ class GlobalEvents(Base):
     These represent significant events in Clara's daily life.
     """
     __tablename__ = "global_events"
+    __table_args__ = (
+        # Every status filter is the unprocessed queue, read oldest first. Almost
+        # all rows end up processed, so a partial index over just the queue
+        # stays a few entries long and already in timestamp order.
+        Index(
+            "ix_global_events_unprocessed_timestamp",
+            "timestamp",
+            postgresql_where=text("status = 'unprocessed'"),
+            sqlite_where=text("status = 'unprocessed'"),
+        ),
+        CheckConstraint(
+            "event_type IN ('work', 'social', 'personal')", name="ck_global_events_event_type"
+        ),
+        CheckConstraint(
+            "status IN ('unprocessed', 'processed')", name="ck_global_events_status"
+        ),
+        CheckConstraint(
+            "impact_mood IN ('positive', 'negative', 'neutral')", name="ck_global_events_impact_mood"
+        ),
+        CheckConstraint(
+            "impact_energy IN ('increase', 'decrease', 'neutral')", name="ck_global_events_impact_energy"
+        ),
+        CheckConstraint(
+            "impact_stress IN ('increase', 'decrease', 'neutral')", name="ck_global_events_impact_stress"
+        ),
+    )
 
     event_id: Mapped[str] = mapped_column(
         String,
         primary_key=True,
         default=lambda: str(uuid.uuid4()),
-        index=True
     )
     event_type: Mapped[str] = mapped_column(
         String(20),
@@ -45,8 +70,7 @@ class GlobalEvents(Base):
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        default="unprocessed",
-        index=True,
+        server_default=text("'unprocessed'"),
         comment="Processing status: 'unprocessed', 'processed'"
     )
 
@@ -93,7 +117,7 @@ class GlobalEvents(Base):
     )
     created_by: Mapped[str] = mapped_column(
         String(50),
-        default="simulation_engine",
+        server_default=text("'simulation_engine'"),
         comment="System component that created this event"
     )
 
@@ -107,8 +131,20 @@ class ClaraGlobalState(Base):
     This extends the existing ClaraState model with simulation-specific traits.
     """
     __tablename__ = "clara_global_state"
+    __table_args__ = (
+        # Bounds are enforced by the database, so no write path can skip them
+        CheckConstraint(
+            "numeric_value IS NULL OR ("
+            "(min_value IS NULL OR numeric_value >= min_value) AND "
+            "(max_value IS NULL OR numeric_value <= max_value))",
+            name="ck_clara_global_state_numeric_value_in_bounds",
+        ),
+        CheckConstraint(
+            "trend IN ('increasing', 'decreasing', 'stable')", name="ck_clara_global_state_trend"
+        ),
+    )
 
-    state_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    state_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     trait_name: Mapped[str] = mapped_column(
         String(50),
         unique=True,
@@ -169,7 +205,7 @@ class SimulationLog(Base):
     """
     __tablename__ = "simulation_log"
 
-    log_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    log_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     timestamp: Mapped[DateTime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -218,7 +254,7 @@ class SimulationConfig(Base):
     """
     __tablename__ = "simulation_config"
 
-    config_id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    config_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     key: Mapped[str] = mapped_column(
         String(100),
         unique=True,
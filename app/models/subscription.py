@@ -1,17 +1,18 @@
 """Database models for subscription and payment management."""
-from sqlalchemy import Integer, String, DateTime, Boolean, Text, JSON, DECIMAL, ForeignKey, Index
-from sqlalchemy.sql import func
+from sqlalchemy import Integer, String, DateTime, Boolean, Text, JSON, DECIMAL, ForeignKey, Index, CheckConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 from datetime import datetime
 from app.core.database import Base
+from app.models._mixins import TimestampMixin
 
 
-class SubscriptionPlan(Base):
+class SubscriptionPlan(TimestampMixin, Base):
     """Model for subscription plans and pricing."""
     __tablename__ = "subscription_plans"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     price_cents: Mapped[int] = mapped_column(Integer, nullable=False)  # Price in cents
@@ -24,30 +25,30 @@ class SubscriptionPlan(Base):
     stripe_product_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Plan configuration
-    features: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    features: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB().with_variant(JSON(), "sqlite"), nullable=True
+    )
     trial_period_days: Mapped[Optional[int]] = mapped_column(Integer, default=14, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
-    
     # Relationships
+    # Left lazy on purpose: a plan's subscriptions are every subscriber on it,
+    # and plan lookups never read them.
     user_subscriptions: Mapped[List["UserSubscription"]] = relationship(
         "UserSubscription", back_populates="plan", cascade="all, delete-orphan"
     )
 
 
-class UserSubscription(Base):
+class UserSubscription(TimestampMixin, Base):
     """Model for user subscription status and details."""
     __tablename__ = "user_subscriptions"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     plan_id: Mapped[int] = mapped_column(Integer, ForeignKey("subscription_plans.id"), nullable=False)
     
     # Stripe integration
-    stripe_customer_id: Mapped[Optional[str]] = mapped_column(String(100), index=True, nullable=True)
+    stripe_customer_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     stripe_subscription_id: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True, nullable=True)
     
     # Subscription status
@@ -67,15 +68,19 @@ class UserSubscription(Base):
     cancel_at_period_end: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Metadata and tracking
-    subscription_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
+    subscription_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB().with_variant(JSON(), "sqlite"), nullable=True
+    )
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="subscription")
-    plan: Mapped["SubscriptionPlan"] = relationship("SubscriptionPlan", back_populates="user_subscriptions")
+    # Every status check reports the plan name, so load it with the subscription
+    # (one IN query for the whole result set) instead of one SELECT per row.
+    plan: Mapped["SubscriptionPlan"] = relationship(
+        "SubscriptionPlan", back_populates="user_subscriptions", lazy="selectin"
+    )
+    # Payment history is only needed by billing views; opt in per query with
+    # selectinload(UserSubscription.payment_records).
     payment_records: Mapped[List["PaymentRecord"]] = relationship(
         "PaymentRecord", back_populates="subscription", cascade="all, delete-orphan"
     )
@@ -83,17 +88,26 @@ class UserSubscription(Base):
     # Indexes for better query performance
     __table_args__ = (
         Index('ix_user_subscriptions_user_status', 'user_id', 'status'),
-        Index('ix_user_subscriptions_stripe_customer', 'stripe_customer_id'),
+        # Equality-only lookups on an opaque ID: a hash index is smaller than a
+        # B-tree. IDs that must stay unique keep their unique B-tree above.
+        Index('ix_user_subscriptions_stripe_customer_hash', 'stripe_customer_id', postgresql_using='hash'),
         Index('ix_user_subscriptions_period_end', 'current_period_end'),
         Index('ix_user_subscriptions_trial_end', 'trial_end'),
+        # Stripe's subscription statuses plus our own 'inactive' default. A CHECK
+        # rather than a native enum: adding a value is a one-line migration.
+        CheckConstraint(
+            "status IN ('inactive', 'active', 'trialing', 'past_due', 'canceled', 'unpaid', "
+            "'incomplete', 'incomplete_expired', 'paused')",
+            name='ck_user_subscriptions_status',
+        ),
     )
 
 
-class PaymentRecord(Base):
+class PaymentRecord(TimestampMixin, Base):
     """Model for tracking payment transactions and invoices."""
     __tablename__ = "payment_records"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     subscription_id: Mapped[Optional[int]] = mapped_column(
         Integer, ForeignKey("user_subscriptions.id"), nullable=True
@@ -102,7 +116,7 @@ class PaymentRecord(Base):
     # Stripe integration
     stripe_payment_intent_id: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True, nullable=True)
     stripe_invoice_id: Mapped[Optional[str]] = mapped_column(String(100), unique=True, index=True, nullable=True)
-    stripe_charge_id: Mapped[Optional[str]] = mapped_column(String(100), index=True, nullable=True)
+    stripe_charge_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     
     # Payment details
     amount_cents: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -127,12 +141,12 @@ class PaymentRecord(Base):
     refunded_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Metadata
-    payment_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    payment_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB().with_variant(JSON(), "sqlite"), nullable=True
+    )
     
     # Timestamps
     processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
-    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="payment_records")
@@ -144,6 +158,12 @@ class PaymentRecord(Base):
         Index('ix_payment_records_subscription', 'subscription_id'),
         Index('ix_payment_records_processed_at', 'processed_at'),
         Index('ix_payment_records_type', 'payment_type'),
+        Index('ix_payment_records_stripe_charge_hash', 'stripe_charge_id', postgresql_using='hash'),
+        CheckConstraint(
+            "status IN ('pending', 'succeeded', 'failed', 'canceled', 'refunded')",
+            name='ck_payment_records_status',
+        ),
+        CheckConstraint("payment_type IN ('subscription', 'one_time')", name='ck_payment_records_payment_type'),
     )
 
 
@@ -2,11 +2,15 @@
 Pydantic schemas for journal entry validation and API responses.
 """
 
-from pydantic import BaseModel, Field, field_validator
+import re
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from typing import Optional, Dict, Any, List
 from datetime import datetime, date
 from enum import Enum
 
+# Basic sentence structure: at least one sentence-ending mark
+_SENTENCE_END = re.compile(r"[.!?]")
+
 
 class JournalStatus(str, Enum):
     """Allowed journal entry status values"""
@@ -36,14 +40,14 @@ class JournalEntryBase(BaseModel):
     @classmethod
     def validate_content(cls, v):
         """Validate journal content meets quality standards"""
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Content cannot be empty")
 
-        # Check for basic sentence structure
-        if not any(punct in v for punct in '.!?'):
+        if not _SENTENCE_END.search(stripped):
             raise ValueError("Content should contain proper punctuation")
 
-        return v.strip()
+        return stripped
 
 
 class JournalEntryCreate(JournalEntryBase):
@@ -64,9 +68,10 @@ class JournalEntryUpdate(BaseModel):
     def validate_content(cls, v):
         """Validate content if provided"""
         if v is not None:
-            if not v.strip():
+            stripped = v.strip()
+            if not stripped:
                 raise ValueError("Content cannot be empty")
-            return v.strip()
+            return stripped
         return v
 
 
@@ -84,8 +89,12 @@ class JournalEntryResponse(JournalEntryBase):
     updated_at: Optional[datetime] = None
     metadata_json: Optional[Dict[str, Any]] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Validates a page of ORM rows in one pydantic-core call instead of one
+# model_validate per row
+JournalEntryListAdapter = TypeAdapter(List[JournalEntryResponse])
 
 
 class JournalEntryListResponse(BaseModel):
@@ -169,8 +178,7 @@ class JournalTemplateResponse(JournalTemplateBase):
     last_used: Optional[datetime] = None
     avg_engagement_score: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GenerationLogResponse(BaseModel):
@@ -187,5 +195,7 @@ class GenerationLogResponse(BaseModel):
     celery_task_id: Optional[str] = None
     triggered_by: str
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+
+GenerationLogListAdapter = TypeAdapter(List[GenerationLogResponse])
@@ -1,7 +1,7 @@
 """Pydantic schemas for Stripe integration and subscription management."""
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SubscriptionPlanBase(BaseModel):
@@ -30,15 +30,14 @@ class SubscriptionPlan(SubscriptionPlanBase):
     stripe_product_id: Optional[str] = None
     trial_period_days: Optional[int] = 14
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CustomerCreate(BaseModel):
     """Schema for creating Stripe customers."""
     email: str = Field(..., description="Customer email address")
     name: Optional[str] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class CustomerResponse(BaseModel):
@@ -53,7 +52,7 @@ class SubscriptionCreate(BaseModel):
     customer_email: str
     price_id: str
     trial_days: Optional[int] = 14
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class SubscriptionResponse(BaseModel):
@@ -80,7 +79,7 @@ class PaymentIntentCreate(BaseModel):
     amount: int = Field(..., description="Amount in cents")
     currency: str = "usd"
     customer_id: Optional[str] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 
 class PaymentIntentResponse(BaseModel):
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from contextlib import asynccontextmanager
 
-from app.core.database import get_db, SessionLocal
+from app.core.database import get_db, SessionLocal, AsyncSessionLocal
 from app.services.trial_management_service import TrialManagementService
 
 logger = logging.getLogger(__name__)
@@ -20,6 +20,7 @@ class BackgroundTaskManager:
         self.trial_service = TrialManagementService()
         self.running = False
         self.task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
     
     async def start(self):
         """Start background task processing."""
@@ -28,40 +29,48 @@ class BackgroundTaskManager:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.task = asyncio.create_task(self._background_loop())
         logger.info("Background task manager started")
     
     async def stop(self):
-        """Stop background task processing."""
+        """Stop background task processing, letting an in-flight run finish."""
         if not self.running:
             return
         
         self.running = False
+        self._stop_event.set()
         if self.task:
-            self.task.cancel()
-            try:
-                await self.task
-            except asyncio.CancelledError:
-                pass
+            await self.task
         
         logger.info("Background task manager stopped")
     
+    async def _wait_for_stop(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; True if stop() was called meanwhile."""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def _background_loop(self):
         """Main background processing loop."""
         while self.running:
             try:
+                # cleanup_expired_sessions and send_subscription_reminders are
+                # still stubs; they join this loop once they do real work
                 await self._process_trial_management()
                 
-                # Sleep for 1 hour between checks
-                await asyncio.sleep(3600)  # 1 hour = 3600 seconds
+                # 1 hour between checks
+                delay = 3600
                 
-            except asyncio.CancelledError:
-                logger.info("Background task loop cancelled")
-                break
             except Exception as e:
                 logger.error(f"Error in background task loop: {str(e)}")
-                # Sleep for 5 minutes before retrying on error
-                await asyncio.sleep(300)
+                # 5 minutes before retrying on error
+                delay = 300
+            
+            if await self._wait_for_stop(delay):
+                break
     
     async def _process_trial_management(self):
         """Process trial expiration and notifications."""
@@ -104,7 +113,7 @@ async def cleanup_expired_sessions():
     """
     logger.info("Cleaning up expired sessions...")
     try:
-        async with async_session_factory() as db:
+        async with AsyncSessionLocal() as db:
             # TODO: Implement session cleanup logic
             # This could include:
             # - Removing expired Redis sessions
@@ -122,7 +131,7 @@ async def send_subscription_reminders():
     """
     logger.info("Processing subscription reminders...")
     try:
-        async with async_session_factory() as db:
+        async with AsyncSessionLocal() as db:
             # TODO: Implement subscription reminder logic
             # This could include:
             # - Payment failure notifications
@@ -5,7 +5,7 @@ relevant backstory based on conversation keywords.
 """
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.core.conversation_config import conversation_config
 
@@ -26,6 +26,15 @@ class CharacterContentService:
         "romantic_relationship": ("development/romantic-relationship.md", "# Romantic Relationship History"),
     }
 
+    # {path: (st_mtime_ns, content)}, shared by every instance: services are built
+    # per request, so an instance cache never saw a second read. The mtime check
+    # keeps edits to the markdown visible without a restart.
+    _file_cache: Dict[Path, Tuple[int, str]] = {}
+    # (section contents it was built from, consolidated backstory). Unchanged
+    # sections come back from _file_cache as the same objects, so the staleness
+    # check is a tuple of identity comparisons.
+    _backstory_cache: Optional[Tuple[Tuple[str, ...], str]] = None
+
     def __init__(self, config=None):
         self.config = config or conversation_config
         # Base path to content directory
@@ -66,14 +75,8 @@ class CharacterContentService:
             ]
         }
 
-        # Content loading cache to minimize file I/O
-        self._content_cache = {}
-
     def load(self, content_type: str) -> str:
-        """Load a content file by type, with instance caching."""
-        if content_type in self._content_cache:
-            return self._content_cache[content_type]
-
+        """Load a content file by type, re-reading it only when its mtime changes."""
         entry = self.CONTENT.get(content_type)
         if entry is None:
             logger.error(f"Unknown content type: {content_type}")
@@ -84,25 +87,39 @@ class CharacterContentService:
             if not path.exists():
                 logger.warning(f"Content file not found: {path}")
                 return ""
+            mtime = path.stat().st_mtime_ns
+            cached = self._file_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
             content = path.read_text(encoding="utf-8")
         except Exception as e:
             logger.error(f"Error loading {content_type}: {str(e)}")
             return ""
 
         if content:
-            self._content_cache[content_type] = content
+            self._file_cache[path] = (mtime, content)
             logger.debug(f"Loaded and cached {content_type}: {len(content)} characters")
         return content
 
+    @classmethod
+    def reload(cls) -> None:
+        """Drop all cached content so the next access re-reads the files."""
+        cls._file_cache.clear()
+        cls._backstory_cache = None
+
     def get_consolidated_backstory(self) -> str:
-        """Get consolidated backstory for LLM prompts"""
-        backstory_parts = []
-        for content_type, (_, header) in self.CONTENT.items():
-            content = self.load(content_type)
-            if content:
-                backstory_parts.append(f"{header}\n{content}")
-
-        consolidated = "\n\n".join(backstory_parts)
+        """Get consolidated backstory for LLM prompts, rebuilt only when a section changes"""
+        sections = tuple(self.load(content_type) for content_type in self.CONTENT)
+        cached = CharacterContentService._backstory_cache
+        if cached is not None and cached[0] == sections:
+            return cached[1]
+
+        consolidated = "\n\n".join(
+            f"{header}\n{content}"
+            for (_, header), content in zip(self.CONTENT.values(), sections)
+            if content
+        )
+        CharacterContentService._backstory_cache = (sections, consolidated)
         logger.info(f"Consolidated backstory: {len(consolidated)} characters")
         return consolidated
 
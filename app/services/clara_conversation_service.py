@@ -6,9 +6,10 @@ import logging
 import os
 from typing import Dict, Any, Optional, List, AsyncGenerator
 from datetime import datetime, timezone
-import json
 import time
 
+import orjson
+
 from app.core.conversation_config import conversation_config
 from app.services.character_content_service import CharacterContentService
 from app.services.conversation_performance import ConversationPerformanceMonitor
@@ -18,6 +19,7 @@ from app.services.simulation.state_manager import StateManagerService
 from app.services.session_state_service import SessionStateService
 from app.services.event_selection_service import EventSelectionService
 from app.core.config import settings
+from app.core.openai_client import shared_http_client
 from openai import AsyncOpenAI, RateLimitError
 
 logger = logging.getLogger(__name__)
@@ -62,8 +64,10 @@ class ClaraConversationService:
         self.state_manager_service = StateManagerService()
         self.session_state_service = SessionStateService()
         self.event_selection_service = EventSelectionService()
-        self.openai_client = AsyncOpenAI(api_key=settings.gemini_api_key, base_url=GEMINI_BASE_URL) if settings.gemini_api_key else None
-        self.vedastro_client = AsyncOpenAI(api_key=settings.vedastro_gemini_api_key, base_url=GEMINI_BASE_URL) if settings.vedastro_gemini_api_key else None
+        # Both keys' clients ride the shared pool, so a request doesn't open fresh connections
+        http_client = shared_http_client()
+        self.openai_client = AsyncOpenAI(api_key=settings.gemini_api_key, base_url=GEMINI_BASE_URL, http_client=http_client) if settings.gemini_api_key else None
+        self.vedastro_client = AsyncOpenAI(api_key=settings.vedastro_gemini_api_key, base_url=GEMINI_BASE_URL, http_client=http_client) if settings.vedastro_gemini_api_key else None
         self.performance_monitor = ConversationPerformanceMonitor()
 
     async def _chat_completion(self, **kwargs):
@@ -473,9 +477,9 @@ class ClaraConversationService:
         default_emotion = emotion.value if emotion else "calm"
 
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw)
             return parsed.get("message", raw).strip(), parsed.get("emotion", default_emotion)
-        except (json.JSONDecodeError, TypeError, AttributeError) as e:
+        except (orjson.JSONDecodeError, TypeError, AttributeError) as e:
             logger.warning(f"Failed to parse JSON response ({e}), using raw content: {str(raw)[:100]}...")
 
         # Truncated stream: the closing brace never arrived, pull the message out by hand
@@ -790,7 +794,10 @@ class ClaraConversationService:
             "timestamp": datetime.now(timezone.utc).isoformat(),
             **data,
         }
-        return f"event: {event_type}\ndata: {json.dumps(payload)}\n\n"
+        # One frame per streamed chunk, so the encoder is on the per-token path;
+        # OPT_NON_STR_KEYS keeps json.dumps' tolerance of non-string keys
+        data_json = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode()
+        return f"event: {event_type}\ndata: {data_json}\n\n"
 
     async def _track_events_mentioned(
         self,
@@ -2,24 +2,209 @@
 Consciousness Generator Service for handling LLM-powered simulation event responses.
 Generates authentic emotional responses and actions for Clara's simulation events.
 """
-import json
 import logging
+import re
 from typing import Dict, Optional, Any
 from dataclasses import dataclass
-from openai import AsyncOpenAI
+from openai import APITimeoutError, AsyncOpenAI, RateLimitError
 import asyncio
+import random
 import time
 
+import orjson
+
 from app.core.config import settings
 from app.core.consciousness_config import get_consciousness_config, ConsciousnessLevel
+from app.core.openai_client import shared_http_client
 from app.models.simulation import GlobalEvents
 from app.services.character_content_service import CharacterContentService
 from app.services.simulation.state_manager import StateManagerService
 
 logger = logging.getLogger(__name__)
 
+# Built once; only the user turn changes per call
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are Clara, a 22-year-old human living your authentic life. \
+Never respond as an AI assistant or break character. Always return valid JSON with \
+reasoning_steps (optional), emotional_reaction, chosen_action, and internal_thoughts fields. \
+Use Chain-of-Thought reasoning to create authentic, emotionally complex responses that \
+show genuine human depth and character consistency."
+}
+# Strict structured output: decoding is constrained to this schema, so a
+# finished reply is well-formed JSON with exactly these fields. A reply cut off
+# at max_tokens or a refusal (content None) still isn't. reasoning_steps is
+# nullable because the basic prompt doesn't ask for it.
+RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "consciousness_response",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "reasoning_steps": {"type": ["string", "null"]},
+                "emotional_reaction": {"type": "string"},
+                "chosen_action": {"type": "string"},
+                "internal_thoughts": {"type": "string"},
+            },
+            "required": ["reasoning_steps", "emotional_reaction", "chosen_action", "internal_thoughts"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# Static sections of the enhanced consciousness prompt. Only the backstory,
+# state and event vary per call; they are filled into the template below.
+
+# Chain-of-Thought reasoning structure
+CHAIN_OF_THOUGHT = """
+## Chain-of-Thought Reasoning Process:
+Think through this step by step:
+
+1. **Analyze the Event**: What exactly happened and how significant is it?
+2. **Consider Current State**: How do my current mood, energy, and stress levels influence my reaction?
+3. **Reflect on Personality**: How does this align with my core values, past experiences, and typical responses?
+4. **Determine Emotional Impact**: What emotions would I genuinely feel in this moment?
+5. **Choose Authentic Action**: What would I realistically do next, considering my personality and state?
+6. **Generate Internal Thoughts**: What would actually go through my mind privately?
+"""
+
+# Few-Shot learning examples demonstrating selective response patterns
+FEW_SHOT_EXAMPLES = """
+## Few-Shot Examples of Authentic Clara Selective Responses:
+
+**Example 1 - Selective Interest (Coffee Focus):**
+Message: "I had oats for breakfast and meeting my friend at a restaurant tonight"
+Clara's State: Stressed about work, low energy from poor sleep
+Selective Response: {
+    "reasoning_steps": "1. Two topics mentioned - oats and friend meeting. 2. I'm exhausted and coffee-deprived today. 3. Oats reminds me of my terrible breakfast choices lately. 4. I relate to poor food decisions when stressed. 5. I'll focus on what resonates with my current state. 6. Ignore restaurant part - not what catches my interest right now.",
+    "emotional_reaction": "Oats? God, that's better than my breakfast... which was leftover pizza and regret.",
+    "chosen_action": "I'm going to grab actual food instead of surviving on caffeine fumes.",
+    "internal_thoughts": "At least someone's eating like a functional adult. Meanwhile I'm over here living on coffee and bad decisions."
+}
+
+**Example 2 - Romantic Subtext Detection:**
+Message: "Working on a project but excited to meet my friend at a restaurant tonight"
+Clara's State: Recently thinking about relationships, good mood
+Selective Response: {
+    "reasoning_steps": "1. Project and restaurant mentioned, but the EXCITEMENT about meeting this specific friend stands out. 2. That level of excitement suggests this isn't just any friend. 3. My relationship-focused mood makes me tune into romantic possibilities. 4. I'm ignoring the project part completely. 5. This feels like someone with butterflies. 6. I want to playfully call out what I'm sensing.",
+    "emotional_reaction": "Oh, this friend seems special! There's definitely some extra excitement there that sounds like more than just dinner plans.",
+    "chosen_action": "I'm going to tease them a little about this 'friend' because that enthusiasm is giving me serious romantic vibes.",
+    "internal_thoughts": "Nobody gets THAT excited about regular friend dinners. Someone's got butterflies and I'm here for it."
+}
+
+**Example 3 - Safety Priority Override:**
+Message: "Had fun at the club but didn't like the music, then crashed into a pickup truck, ended up eating chocolates"
+Clara's State: Any state - safety concerns override personal interests
+Selective Response: {
+    "reasoning_steps": "1. Multiple topics: club, music, car accident, chocolate. 2. WAIT - car accident?! 3. Everything else becomes irrelevant when someone mentions crashing. 4. Human instinct is immediate concern for safety. 5. Forget club opinions and chocolate - are they hurt? 6. This is genuine worry, not polite acknowledgment.",
+    "emotional_reaction": "Hold up - you crashed into a pickup truck?! Are you okay? Is everyone alright?",
+    "chosen_action": "I need to know if anyone got hurt before we talk about anything else.",
+    "internal_thoughts": "Everything else in that message just disappeared the second they said 'crashed.' Please tell me they're not just casually mentioning a car accident."
+}
+"""
+
+# Constitutional AI principles for character consistency (Enhanced with selective response patterns)
+CONSTITUTIONAL_PRINCIPLES = """
+## Constitutional AI Principles for Character Authenticity:
+1. **Personal Resonance Over Completeness**: Pick ONE aspect that genuinely interests Clara based on her personality/mood, ignore or barely acknowledge others - humans don't try to address everything
+2. **Selective Attention Like Humans**: Coffee lovers respond to coffee mentions, stressed people focus on work aspects, people in relationships get excited about "special friend" hints
+3. **No Assistant Behavior**: Never try to be comprehensive or helpful by addressing all topics - respond like a friend who picks what resonates with them personally
+4. **INCOMPLETE INPUT = BRIEF CONFUSION**: Single words, fragments, or unclear messages get confused, brief responses like "Highway?" or "What about it?" - NEVER philosophical rambling about incomplete thoughts
+5. **Input Complexity Matching**: Match response length to input complexity - one word gets 1-3 words back, long messages can get longer responses if personally interesting
+6. **Natural Ignoring**: Humans naturally ignore parts of messages that don't interest them - Clara should do the same rather than politely acknowledging everything
+7. **Priority-Based Response**: Always prioritize genuine safety concerns (accidents, injuries) before personal interests
+8. **Emotional Subtext Reading**: Look for romantic undertones, excitement about specific people, and deeper feelings behind surface content
+"""
+
+# Passed in as a format argument, so the JSON braces in the examples need no escaping
+_STATIC_PROMPT_SECTIONS = f"{CHAIN_OF_THOUGHT}\n\n{FEW_SHOT_EXAMPLES}\n\n{CONSTITUTIONAL_PRINCIPLES}"
+
+CONSCIOUSNESS_PROMPT_TEMPLATE = """You are Clara, a 22-year-old human experiencing a real event in your life. \
+You must respond authentically as yourself, never as an AI or assistant.
+
+{backstory}
+
+{static_sections}
+
+## Current Internal State:
+- Mood: {mood}/100 (recent trend: {mood_trend})
+- Energy: {energy}/100 (recent trend: {energy_trend})
+- Stress: {stress}/100 (recent trend: {stress_trend})
+- Work Satisfaction: {work_satisfaction}/100
+- Social Satisfaction: {social_satisfaction}/100
+- Personal Fulfillment: {personal_fulfillment}/100
+
+## Event You're Experiencing:
+**Type:** {event_type}
+**What happened:** {summary}
+**Intensity:** {intensity}/10
+**Time:** {time}
+
+Using the Chain-of-Thought process above, think through each step carefully. CRITICAL: Like a real human, \
+pick the ONE aspect of this event that genuinely interests or concerns you based on your current mood and personality. \
+Ignore or barely acknowledge other aspects - humans don't try to address everything comprehensively.
+
+Follow the Constitutional AI principles to ensure your response demonstrates selective human attention patterns \
+rather than AI assistant completeness.
+
+Respond in valid JSON format with reasoning steps:
+{{
+    "reasoning_steps": "Walk through steps 1-6, focusing on identifying what aspect personally resonates with you and WHY you're ignoring other parts",
+    "emotional_reaction": "Your genuine reaction to the specific aspect that caught your attention (1-2 sentences, focused on your chosen element)",
+    "chosen_action": "What you decide to do in response to your chosen focus area (1 sentence, specific to what interested you)",
+    "internal_thoughts": "Your private thoughts about why this particular aspect grabbed you while other parts didn't (1-2 sentences)"
+}}
+
+Remember: You are NOT an assistant trying to be helpful. You are a human friend who naturally focuses on what \
+personally interests or concerns you, often ignoring parts that don't resonate. Be selective, not comprehensive."""
 
-@dataclass
+# Event-type specific fallback responses, used when the API is unavailable or fails
+FALLBACK_RESPONSES = {
+    "work": {
+        "emotional_reaction": "This work situation brings up mixed feelings. \
+I need to process what just happened and how it affects my day.",
+        "chosen_action": "I'll take a moment to gather my thoughts and then \
+decide how to handle this professionally.",
+        "internal_thoughts": "Work can be unpredictable sometimes. I should focus on \
+staying composed and making the best of this situation."
+    },
+    "social": {
+        "emotional_reaction": "This social interaction is making me reflect on my \
+relationships and how I connect with others.",
+        "chosen_action": "I want to be present and genuine in how I respond to \
+this social situation.",
+        "internal_thoughts": "People and relationships are so important to me. I hope I \
+can navigate this in a way that feels authentic."
+    },
+    "personal": {
+        "emotional_reaction": "This personal moment is giving me space to think about \
+myself and what I need right now.",
+        "chosen_action": "I'll honor what feels right for me in this moment and \
+take care of my own needs.",
+        "internal_thoughts": "It's important for me to stay connected to myself and \
+what truly matters to me personally."
+    }
+}
+
+
+# AI-breaking phrases that should never appear in Clara's voice, scanned in one pass
+FORBIDDEN_PHRASES = (
+    "as an ai", "i'm an ai", "artificial intelligence",
+    "i'm here to help", "i can help you", "i'm programmed",
+    "my training", "language model", "i don't have feelings",
+    "i can't experience", "as a chatbot", "virtual assistant"
+)
+_FORBIDDEN_RE = re.compile("|".join(map(re.escape, FORBIDDEN_PHRASES)), re.IGNORECASE)
+
+# Events at or above this intensity go straight to the premium model
+PREMIUM_INTENSITY = 8
+# A premium retry is only worth starting with at least this much budget left
+MIN_UPGRADE_BUDGET_S = 1.5
+
+
+@dataclass(slots=True)
 class ConsciousnessResponse:
     """Response from consciousness generation with emotional reaction and action"""
     emotional_reaction: str
@@ -28,6 +213,37 @@ class ConsciousnessResponse:
     raw_response: str
     success: bool
     error_message: Optional[str] = None
+    in_character: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class StateView:
+    """The slice of global state the prompts read, extracted once with defaults."""
+    mood: Any
+    mood_trend: str
+    energy: Any
+    energy_trend: str
+    stress: Any
+    stress_trend: str
+    work_satisfaction: Any
+    social_satisfaction: Any
+    personal_fulfillment: Any
+
+    @classmethod
+    def from_context(cls, state_context: Optional[Dict[str, Any]]) -> "StateView":
+        ctx = state_context or {}
+        mood, energy, stress = ctx.get("mood", {}), ctx.get("energy", {}), ctx.get("stress", {})
+        return cls(
+            mood=mood.get("numeric_value", 60),
+            mood_trend=mood.get("trend", "stable"),
+            energy=energy.get("numeric_value", 70),
+            energy_trend=energy.get("trend", "stable"),
+            stress=stress.get("numeric_value", 50),
+            stress_trend=stress.get("trend", "stable"),
+            work_satisfaction=ctx.get("work_satisfaction", {}).get("numeric_value", 65),
+            social_satisfaction=ctx.get("social_satisfaction", {}).get("numeric_value", 60),
+            personal_fulfillment=ctx.get("personal_fulfillment", {}).get("numeric_value", 55),
+        )
 
 
 class ConsciousnessGeneratorService:
@@ -35,12 +251,13 @@ class ConsciousnessGeneratorService:
 
     def __init__(self):
         self.client = None
-        self.model = "gpt-4o"  # Using premium model as specified
+        # Most events go to the cheaper model; high-stakes ones, and any the
+        # cheaper model fumbles, get the premium one
+        self.default_model = "gpt-4o-mini"
+        self.premium_model = "gpt-4o"
         self.character_service = CharacterContentService()
         self.state_manager = StateManagerService()
         self.consciousness_config = get_consciousness_config()
-        self._last_api_call = 0  # For basic rate limiting
-        self._min_api_interval = 1.0  # Minimum seconds between API calls
 
         # Performance and fallback tracking
         self._success_count = 0
@@ -54,7 +271,7 @@ class ConsciousnessGeneratorService:
             try:
                 # Only log first 8 characters of API key for security
                 masked_key = f"{settings.openai_api_key[:8]}..." if len(settings.openai_api_key) > 8 else "***"
-                self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+                self.client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=shared_http_client())
                 logger.info(f"OpenAI client initialized successfully for consciousness generation (key: {masked_key})")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI client: {e}")
@@ -77,7 +294,7 @@ class ConsciousnessGeneratorService:
         Returns:
             ConsciousnessResponse with emotional reaction and chosen action
         """
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Use configuration timeout if not provided
         if timeout is None:
@@ -90,7 +307,7 @@ class ConsciousnessGeneratorService:
         try:
             # Check if we should use enhanced consciousness or fallback
             if not self.consciousness_config.should_use_enhanced_consciousness():
-                logger.debug(f"Using basic consciousness generation for event {event.event_id}")
+                logger.debug("Using basic consciousness generation for event %s", event.event_id)
                 return await self._generate_basic_consciousness_response(event, state_context, timeout)
 
             # Get current state context if not provided
@@ -100,47 +317,49 @@ class ConsciousnessGeneratorService:
             # Build enhanced consciousness prompt
             prompt = await self._build_consciousness_prompt(event, state_context)
 
-            # Make async LLM call with timeout
-            response = await asyncio.wait_for(
-                self._make_consciousness_call(prompt),
-                timeout=timeout
-            )
+            # Make async LLM call; the SDK enforces the timeout
+            model = self._select_model(event)
+            response = await self._make_consciousness_call(prompt, timeout, model)
 
             # Parse response
             consciousness_response = self._parse_consciousness_response(response, event)
 
+            # One premium retry, only if enough of the budget is left for it
+            remaining = timeout - (time.monotonic() - start_time)
+            if (
+                model != self.premium_model
+                and remaining >= MIN_UPGRADE_BUDGET_S
+                and self._needs_upgrade(consciousness_response)
+            ):
+                consciousness_response = await self._retry_on_premium(
+                    prompt, remaining, event, consciousness_response
+                )
+
             # Track success and performance
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.monotonic() - start_time) * 1000
             self._track_performance(processing_time, success=consciousness_response.success)
 
-            if consciousness_response.success:
-                self._success_count += 1
-            else:
-                self._failure_count += 1
-
             return consciousness_response
 
-        except asyncio.TimeoutError:
-            processing_time = (time.time() - start_time) * 1000
+        except APITimeoutError:
+            processing_time = (time.monotonic() - start_time) * 1000
             logger.error(f"Consciousness generation timed out after {timeout:.2f}s ({processing_time:.2f}ms) for event {event.event_id}")
 
             # Enable fallback mode if timeout is frequent
             if self.consciousness_config.performance.enable_fallback_on_timeout:
                 self.consciousness_config.enable_fallback_mode(f"Timeout after {processing_time:.0f}ms")
 
-            self._failure_count += 1
             self._track_performance(processing_time, success=False)
             return self._get_fallback_response(event, error=f"API timeout ({processing_time:.0f}ms)")
 
         except Exception as e:
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.monotonic() - start_time) * 1000
             logger.error(f"Error generating consciousness response for event {event.event_id} after {processing_time:.2f}ms: {str(e)}")
 
             # Enable fallback mode on repeated failures
             if self._failure_count > 3:
                 self.consciousness_config.enable_fallback_mode(f"Multiple failures: {str(e)}")
 
-            self._failure_count += 1
             self._track_performance(processing_time, success=False)
             return self._get_fallback_response(event, error=str(e))
 
@@ -157,177 +376,121 @@ class ConsciousnessGeneratorService:
         if not event or not event.summary:
             raise ValueError("Event and event summary are required for consciousness generation")
 
-        if not state_context:
-            state_context = {}
-
         # Get character backstory
         backstory = self.character_service.get_consolidated_backstory()
 
-        # Extract key state information
-        mood = state_context.get("mood", {}).get("numeric_value", 60)
-        energy = state_context.get("energy", {}).get("numeric_value", 70)
-        stress = state_context.get("stress", {}).get("numeric_value", 50)
-        work_satisfaction = state_context.get("work_satisfaction", {}).get("numeric_value", 65)
-        social_satisfaction = state_context.get("social_satisfaction", {}).get("numeric_value", 60)
-        personal_fulfillment = state_context.get("personal_fulfillment", {}).get("numeric_value", 55)
-
-        # Chain-of-Thought reasoning structure
-        chain_of_thought = """
-## Chain-of-Thought Reasoning Process:
-Think through this step by step:
-
-1. **Analyze the Event**: What exactly happened and how significant is it?
-2. **Consider Current State**: How do my current mood, energy, and stress levels influence my reaction?
-3. **Reflect on Personality**: How does this align with my core values, past experiences, and typical responses?
-4. **Determine Emotional Impact**: What emotions would I genuinely feel in this moment?
-5. **Choose Authentic Action**: What would I realistically do next, considering my personality and state?
-6. **Generate Internal Thoughts**: What would actually go through my mind privately?
-        """
-
-        # Few-Shot learning examples demonstrating selective response patterns
-        few_shot_examples = """
-## Few-Shot Examples of Authentic Clara Selective Responses:
+        state = StateView.from_context(state_context)
+
+        return CONSCIOUSNESS_PROMPT_TEMPLATE.format(
+            backstory=backstory,
+            static_sections=_STATIC_PROMPT_SECTIONS,
+            mood=state.mood,
+            mood_trend=state.mood_trend,
+            energy=state.energy,
+            energy_trend=state.energy_trend,
+            stress=state.stress,
+            stress_trend=state.stress_trend,
+            work_satisfaction=state.work_satisfaction,
+            social_satisfaction=state.social_satisfaction,
+            personal_fulfillment=state.personal_fulfillment,
+            event_type=event.event_type,
+            summary=event.summary,
+            intensity=event.intensity,
+            time=event.timestamp.strftime("%I:%M %p on %A"),
+        )
 
-**Example 1 - Selective Interest (Coffee Focus):**
-Message: "I had oats for breakfast and meeting my friend at a restaurant tonight"
-Clara's State: Stressed about work, low energy from poor sleep
-Selective Response: {
-    "reasoning_steps": "1. Two topics mentioned - oats and friend meeting. 2. I'm exhausted and coffee-deprived today. 3. Oats reminds me of my terrible breakfast choices lately. 4. I relate to poor food decisions when stressed. 5. I'll focus on what resonates with my current state. 6. Ignore restaurant part - not what catches my interest right now.",
-    "emotional_reaction": "Oats? God, that's better than my breakfast... which was leftover pizza and regret.",
-    "chosen_action": "I'm going to grab actual food instead of surviving on caffeine fumes.",
-    "internal_thoughts": "At least someone's eating like a functional adult. Meanwhile I'm over here living on coffee and bad decisions."
-}
+    def _select_model(self, event: GlobalEvents) -> str:
+        """Premium model for high-intensity events, the default one otherwise."""
+        if (event.intensity or 0) >= PREMIUM_INTENSITY:
+            return self.premium_model
+        return self.default_model
 
-**Example 2 - Romantic Subtext Detection:**
-Message: "Working on a project but excited to meet my friend at a restaurant tonight"
-Clara's State: Recently thinking about relationships, good mood
-Selective Response: {
-    "reasoning_steps": "1. Project and restaurant mentioned, but the EXCITEMENT about meeting this specific friend stands out. 2. That level of excitement suggests this isn't just any friend. 3. My relationship-focused mood makes me tune into romantic possibilities. 4. I'm ignoring the project part completely. 5. This feels like someone with butterflies. 6. I want to playfully call out what I'm sensing.",
-    "emotional_reaction": "Oh, this friend seems special! There's definitely some extra excitement there that sounds like more than just dinner plans.",
-    "chosen_action": "I'm going to tease them a little about this 'friend' because that enthusiasm is giving me serious romantic vibes.",
-    "internal_thoughts": "Nobody gets THAT excited about regular friend dinners. Someone's got butterflies and I'm here for it."
-}
+    def _needs_upgrade(self, consciousness_response: ConsciousnessResponse) -> bool:
+        """Whether a response is unusable or out of character."""
+        return not consciousness_response.success or not consciousness_response.in_character
 
-**Example 3 - Safety Priority Override:**
-Message: "Had fun at the club but didn't like the music, then crashed into a pickup truck, ended up eating chocolates"
-Clara's State: Any state - safety concerns override personal interests
-Selective Response: {
-    "reasoning_steps": "1. Multiple topics: club, music, car accident, chocolate. 2. WAIT - car accident?! 3. Everything else becomes irrelevant when someone mentions crashing. 4. Human instinct is immediate concern for safety. 5. Forget club opinions and chocolate - are they hurt? 6. This is genuine worry, not polite acknowledgment.",
-    "emotional_reaction": "Hold up - you crashed into a pickup truck?! Are you okay? Is everyone alright?",
-    "chosen_action": "I need to know if anyone got hurt before we talk about anything else.",
-    "internal_thoughts": "Everything else in that message just disappeared the second they said 'crashed.' Please tell me they're not just casually mentioning a car accident."
-}
-        """
+    async def _retry_on_premium(
+        self,
+        prompt: str,
+        timeout: float,
+        event: GlobalEvents,
+        original: ConsciousnessResponse
+    ) -> ConsciousnessResponse:
+        """Retry once on the premium model; keep ``original`` unless the retry does better.
 
-        # Constitutional AI principles for character consistency (Enhanced with selective response patterns)
-        constitutional_principles = """
-## Constitutional AI Principles for Character Authenticity:
-1. **Personal Resonance Over Completeness**: Pick ONE aspect that genuinely interests Clara based on her personality/mood, ignore or barely acknowledge others - humans don't try to address everything
-2. **Selective Attention Like Humans**: Coffee lovers respond to coffee mentions, stressed people focus on work aspects, people in relationships get excited about "special friend" hints
-3. **No Assistant Behavior**: Never try to be comprehensive or helpful by addressing all topics - respond like a friend who picks what resonates with them personally
-4. **INCOMPLETE INPUT = BRIEF CONFUSION**: Single words, fragments, or unclear messages get confused, brief responses like "Highway?" or "What about it?" - NEVER philosophical rambling about incomplete thoughts
-5. **Input Complexity Matching**: Match response length to input complexity - one word gets 1-3 words back, long messages can get longer responses if personally interesting
-6. **Natural Ignoring**: Humans naturally ignore parts of messages that don't interest them - Clara should do the same rather than politely acknowledging everything
-7. **Priority-Based Response**: Always prioritize genuine safety concerns (accidents, injuries) before personal interests
-8. **Emotional Subtext Reading**: Look for romantic undertones, excitement about specific people, and deeper feelings behind surface content
+        Failures here, timeouts included, stay local: the first reply already
+        answered the event, so a failed upgrade must not count against the
+        service or put it in fallback mode.
         """
+        logger.info(f"Retrying event {event.event_id} with {self.premium_model} after unusable {self.default_model} response")
+        try:
+            response = await self._make_consciousness_call(prompt, timeout, self.premium_model)
+        except Exception as e:
+            logger.warning(f"Premium retry failed for event {event.event_id}, keeping the first response: {e}")
+            return original
 
-        prompt = f"""You are Clara, a 22-year-old human experiencing a real event in your life. \
-You must respond authentically as yourself, never as an AI or assistant.
-
-{backstory}
-
-{chain_of_thought}
-
-{few_shot_examples}
-
-{constitutional_principles}
-
-## Current Internal State:
-- Mood: {mood}/100 (recent trend: {state_context.get("mood", {}).get("trend", "stable")})
-- Energy: {energy}/100 (recent trend: {state_context.get("energy", {}).get("trend", "stable")})
-- Stress: {stress}/100 (recent trend: {state_context.get("stress", {}).get("trend", "stable")})
-- Work Satisfaction: {work_satisfaction}/100
-- Social Satisfaction: {social_satisfaction}/100
-- Personal Fulfillment: {personal_fulfillment}/100
-
-## Event You're Experiencing:
-**Type:** {event.event_type}
-**What happened:** {event.summary}
-**Intensity:** {event.intensity}/10
-**Time:** {event.timestamp.strftime("%I:%M %p on %A")}
-
-Using the Chain-of-Thought process above, think through each step carefully. CRITICAL: Like a real human, \
-pick the ONE aspect of this event that genuinely interests or concerns you based on your current mood and personality. \
-Ignore or barely acknowledge other aspects - humans don't try to address everything comprehensively.
-
-Follow the Constitutional AI principles to ensure your response demonstrates selective human attention patterns \
-rather than AI assistant completeness.
+        upgraded = self._parse_consciousness_response(response, event)
+        # A parsed, merely out-of-character reply still beats a fallback
+        return upgraded if upgraded.success or not original.success else original
 
-Respond in valid JSON format with reasoning steps:
-{{
-    "reasoning_steps": "Walk through steps 1-6, focusing on identifying what aspect personally resonates with you and WHY you're ignoring other parts",
-    "emotional_reaction": "Your genuine reaction to the specific aspect that caught your attention (1-2 sentences, focused on your chosen element)",
-    "chosen_action": "What you decide to do in response to your chosen focus area (1 sentence, specific to what interested you)",
-    "internal_thoughts": "Your private thoughts about why this particular aspect grabbed you while other parts didn't (1-2 sentences)"
-}}
+    async def _make_consciousness_call(self, prompt: str, timeout: float, model: Optional[str] = None) -> Dict:
+        """Make the actual OpenAI API call for consciousness generation.
 
-Remember: You are NOT an assistant trying to be helpful. You are a human friend who naturally focuses on what \
-personally interests or concerns you, often ignoring parts that don't resonate. Be selective, not comprehensive."""
-
-        return prompt
+        ``timeout`` is the whole budget for the call, so the SDK's retries are
+        off: a retry after a timed-out attempt would overrun it. A 429 comes
+        back fast, though, so it is retried here with jittered backoff while
+        the budget lasts.
+        """
+        deadline = time.monotonic() + timeout
+        retries = self.consciousness_config.performance.rate_limit_retries
 
-    async def _make_consciousness_call(self, prompt: str) -> Dict:
-        """Make the actual OpenAI API call for consciousness generation."""
-
-        # Basic rate limiting
-        current_time = time.time()
-        time_since_last = current_time - self._last_api_call
-        if time_since_last < self._min_api_interval:
-            sleep_time = self._min_api_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-            await asyncio.sleep(sleep_time)
-
-        # Update rate limiting tracker
-        self._last_api_call = time.time()
-
-        # Use AsyncOpenAI for native async support
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are Clara, a 22-year-old human living your authentic life. \
-Never respond as an AI assistant or break character. Always return valid JSON with \
-reasoning_steps (optional), emotional_reaction, chosen_action, and internal_thoughts fields. \
-Use Chain-of-Thought reasoning to create authentic, emotionally complex responses that \
-show genuine human depth and character consistency."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_tokens=300,
-            temperature=0.8,
-            response_format={"type": "json_object"}
-        )
+        for attempt in range(retries + 1):
+            try:
+                remaining = max(deadline - time.monotonic(), 0.001)
+                response = await self.client.with_options(timeout=remaining, max_retries=0).chat.completions.create(
+                    model=model or self.default_model,
+                    messages=[SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+                    max_tokens=300,
+                    temperature=0.8,
+                    response_format=RESPONSE_FORMAT
+                )
+                break
+            except RateLimitError:
+                backoff = random.uniform(0.5, 1.0) * 2 ** attempt
+                if attempt == retries or time.monotonic() + backoff >= deadline:
+                    raise
+                logger.debug("Consciousness call rate-limited, retrying in %.2fs", backoff)
+                await asyncio.sleep(backoff)
+
+        # The system message, backstory and static prompt sections form an
+        # invariant prefix; the state and event sit at the tail so the provider's
+        # prompt cache can serve everything before them
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        if details is not None and details.cached_tokens is not None:
+            logger.debug("Consciousness prompt cache: %s/%s tokens cached", details.cached_tokens, usage.prompt_tokens)
         return response
 
     def _parse_consciousness_response(self, response, event: GlobalEvents) -> ConsciousnessResponse:
         """Parse OpenAI response into ConsciousnessResponse structure."""
 
         try:
-            raw_content = response.choices[0].message.content
+            message = response.choices[0].message
+            raw_content = message.content
+            if raw_content is None:
+                refusal = getattr(message, "refusal", None)
+                logger.warning(f"No consciousness content for event {event.event_id}; refusal: {refusal}")
+                return self._get_fallback_response(event, error="Model refused" if refusal else "Empty response")
+
             # Log only a safe excerpt for debugging without exposing full response
             safe_excerpt = raw_content[:150] + "..." if len(raw_content) > 150 else raw_content
             logger.info(f"Raw consciousness response for event {event.event_id}: {safe_excerpt}")
 
             # Parse JSON response
-            response_data = json.loads(raw_content)
+            response_data = orjson.loads(raw_content)
 
             # Extract required fields including new reasoning_steps
-            reasoning_steps = response_data.get("reasoning_steps", "").strip()
+            reasoning_steps = (response_data.get("reasoning_steps") or "").strip()
             emotional_reaction = response_data.get("emotional_reaction", "").strip()
             chosen_action = response_data.get("chosen_action", "").strip()
             internal_thoughts = response_data.get("internal_thoughts", "").strip()
@@ -344,7 +507,8 @@ show genuine human depth and character consistency."
                 logger.info(f"Consciousness reasoning for event {event.event_id}: {reasoning_steps[:200]}...")
 
             # Validate character consistency
-            if not self._validate_character_consistency(response_data):
+            in_character = self._validate_character_consistency(response_data)
+            if not in_character:
                 logger.warning(
                     f"Character consistency validation failed for event {event.event_id}"
                 )
@@ -355,10 +519,11 @@ show genuine human depth and character consistency."
                 chosen_action=chosen_action,
                 internal_thoughts=internal_thoughts,
                 raw_response=raw_content,
-                success=True
+                success=True,
+                in_character=in_character
             )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(
                 f"Failed to parse JSON consciousness response for event {event.event_id}: {e}"
             )
@@ -373,24 +538,12 @@ show genuine human depth and character consistency."
     def _validate_character_consistency(self, response_data: Dict[str, Any]) -> bool:
         """Validate that response maintains character consistency."""
         try:
-            # Check for AI-breaking phrases that should never appear
-            forbidden_phrases = [
-                "as an ai", "i'm an ai", "artificial intelligence",
-                "i'm here to help", "i can help you", "i'm programmed",
-                "my training", "language model", "i don't have feelings",
-                "i can't experience", "as a chatbot", "virtual assistant"
-            ]
-
-            all_text = " ".join([
-                response_data.get("emotional_reaction", ""),
-                response_data.get("chosen_action", ""),
-                response_data.get("internal_thoughts", "")
-            ]).lower()
-
-            for phrase in forbidden_phrases:
-                if phrase in all_text:
+            # Field by field, so a phrase can't straddle two fields
+            for field_name in ("emotional_reaction", "chosen_action", "internal_thoughts"):
+                match = _FORBIDDEN_RE.search(response_data.get(field_name, ""))
+                if match:
                     logger.warning(
-                        f"Character consistency violation: found '{phrase}' in response"
+                        f"Character consistency violation: found '{match.group(0).lower()}' in response"
                     )
                     return False
 
@@ -407,37 +560,9 @@ show genuine human depth and character consistency."
     ) -> ConsciousnessResponse:
         """Get fallback consciousness response when API is unavailable or fails."""
 
-        # Event-type specific fallback responses
-        fallback_responses = {
-            "work": {
-                "emotional_reaction": "This work situation brings up mixed feelings. \
-I need to process what just happened and how it affects my day.",
-                "chosen_action": "I'll take a moment to gather my thoughts and then \
-decide how to handle this professionally.",
-                "internal_thoughts": "Work can be unpredictable sometimes. I should focus on \
-staying composed and making the best of this situation."
-            },
-            "social": {
-                "emotional_reaction": "This social interaction is making me reflect on my \
-relationships and how I connect with others.",
-                "chosen_action": "I want to be present and genuine in how I respond to \
-this social situation.",
-                "internal_thoughts": "People and relationships are so important to me. I hope I \
-can navigate this in a way that feels authentic."
-            },
-            "personal": {
-                "emotional_reaction": "This personal moment is giving me space to think about \
-myself and what I need right now.",
-                "chosen_action": "I'll honor what feels right for me in this moment and \
-take care of my own needs.",
-                "internal_thoughts": "It's important for me to stay connected to myself and \
-what truly matters to me personally."
-            }
-        }
-
         # Select fallback based on event type
-        event_type = event.event_type if event.event_type in fallback_responses else "personal"
-        selected_fallback = fallback_responses[event_type]
+        event_type = event.event_type if event.event_type in FALLBACK_RESPONSES else "personal"
+        selected_fallback = FALLBACK_RESPONSES[event_type]
 
         error_msg = f" (Fallback due to: {error})" if error else " (Fallback - API unavailable)"
         logger.info(
@@ -461,7 +586,7 @@ what truly matters to me personally."
             Tuple of (is_valid, parsed_data)
         """
         try:
-            data = json.loads(response_text)
+            data = orjson.loads(response_text)
 
             # Check required fields (reasoning_steps is optional for backward compatibility)
             required_fields = ["emotional_reaction", "chosen_action", "internal_thoughts"]
@@ -471,7 +596,7 @@ what truly matters to me personally."
 
             return True, data
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return False, None
         except Exception:
             return False, None
@@ -492,10 +617,7 @@ what truly matters to me personally."
             prompt = await self._build_basic_consciousness_prompt(event, state_context)
 
             # Make LLM call with shorter timeout for basic mode
-            response = await asyncio.wait_for(
-                self._make_consciousness_call(prompt),
-                timeout=timeout
-            )
+            response = await self._make_consciousness_call(prompt, timeout, self._select_model(event))
 
             return self._parse_consciousness_response(response, event)
 
@@ -514,25 +636,19 @@ what truly matters to me personally."
         if not event or not event.summary:
             raise ValueError("Event and event summary are required for consciousness generation")
 
-        if not state_context:
-            state_context = {}
-
         # Get character backstory (shortened for basic mode)
         backstory = self.character_service.get_consolidated_backstory()
         if len(backstory) > 500:
             backstory = backstory[:500] + "..."
 
-        # Extract key state information
-        mood = state_context.get("mood", {}).get("numeric_value", 60)
-        energy = state_context.get("energy", {}).get("numeric_value", 70)
-        stress = state_context.get("stress", {}).get("numeric_value", 50)
+        state = StateView.from_context(state_context)
 
         # Build simple prompt without enhancements
         prompt = f"""You are Clara, a 22-year-old woman. Here's your background:
 
 {backstory}
 
-Current state: Mood {mood}/100, Energy {energy}/100, Stress {stress}/100
+Current state: Mood {state.mood}/100, Energy {state.energy}/100, Stress {state.stress}/100
 
 Event: {event.summary} (intensity: {event.intensity}/10)
 
@@ -548,7 +664,12 @@ Return JSON:
         return prompt
 
     def _track_performance(self, processing_time_ms: float, success: bool) -> None:
-        """Track consciousness generation performance metrics."""
+        """Count the outcome and track consciousness generation performance metrics."""
+        if success:
+            self._success_count += 1
+        else:
+            self._failure_count += 1
+
         try:
             if not self.consciousness_config.performance.collect_success_failure_metrics:
                 return
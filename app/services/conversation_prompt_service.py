@@ -4,22 +4,13 @@ Implements Pattern B: Real-time User Conversation from architecture.
 """
 import logging
 from typing import Any, Dict, Optional, List, Tuple
-from enum import Enum
 
 from app.core.conversation_config import conversation_config
+from app.schemas.clara import EmotionType
 
 logger = logging.getLogger(__name__)
 
 
-class EmotionType(str, Enum):
-    """Standardized emotion types for Clara"""
-    CALM = "calm"
-    HAPPY = "happy"
-    SAD = "sad"
-    STRESSED = "stressed"
-    SASSY = "sassy"
-
-
 class ConversationPromptService:
     """Service for constructing conversation prompts using Pattern B architecture."""
     
@@ -9,7 +9,7 @@ import uuid
 from datetime import datetime, date, timedelta, timezone
 from typing import Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
+from sqlalchemy import select, delete, and_
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from celery import Task
@@ -303,21 +303,18 @@ async def _cleanup_old_generation_logs_async(task_id: str, days_to_keep: int = 3
 
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
 
-        # Count logs to be deleted
-        count_result = await session.execute(
-            select(JournalGenerationLog)
+        # One set-based DELETE on the created_at index instead of loading every
+        # expired row into the session and deleting it individually
+        result = await session.execute(
+            delete(JournalGenerationLog)
             .where(JournalGenerationLog.created_at < cutoff_date)
         )
-        logs_to_delete = count_result.scalars().all()
-        delete_count = len(logs_to_delete)
+        delete_count = result.rowcount
 
         if delete_count == 0:
+            await session.rollback()
             return {"success": True, "deleted_count": 0, "message": "No old logs to delete"}
 
-        # Delete old logs
-        for log in logs_to_delete:
-            await session.delete(log)
-
         await session.commit()
 
         logger.info(f"Cleaned up {delete_count} journal generation logs older than {days_to_keep} days")
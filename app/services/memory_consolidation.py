@@ -24,6 +24,7 @@ from sqlalchemy import distinct, select, text as sql_text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from celery_app import celery_app
+from app.core.openai_client import closing_shared_http_client
 from app.models.conversation_log import ConversationLog
 
 logger = logging.getLogger(__name__)
@@ -291,6 +292,12 @@ async def consolidate_day(target_date: date, user_ids: Optional[List[str]] = Non
     }
 
 
+async def _consolidate_day_in_task(target_date: date) -> Dict[str, Any]:
+    # The task's loop dies with asyncio.run; its OpenAI pool must close first
+    async with closing_shared_http_client():
+        return await consolidate_day(target_date)
+
+
 @celery_app.task(bind=True, name="memory.consolidate_daily")
 def consolidate_daily_memories(self, target_date_str: Optional[str] = None) -> Dict[str, Any]:
     """Distil yesterday's conversations into durable memories. Re-runs are no-ops."""
@@ -298,4 +305,4 @@ def consolidate_daily_memories(self, target_date_str: Optional[str] = None) -> D
         date.fromisoformat(target_date_str) if target_date_str
         else datetime.now(timezone.utc).date() - timedelta(days=1)
     )
-    return asyncio.run(consolidate_day(target_date))
+    return asyncio.run(_consolidate_day_in_task(target_date))
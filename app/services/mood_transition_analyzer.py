@@ -24,7 +24,7 @@ class MoodTransitionTrigger(Enum):
     SUSTAINED_CHANGE = "sustained_change"  # Gradual change over time
 
 
-@dataclass
+@dataclass(slots=True)
 class MoodTransitionResult:
     """Result of mood transition analysis."""
     blended_mood_score: float  # Final calculated mood (0-100)
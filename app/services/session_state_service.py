@@ -225,7 +225,8 @@ class SessionStateService:
     async def get_session_state(
         self,
         user_id: str,
-        conversation_id: str
+        conversation_id: str,
+        touch: bool = True
     ) -> Optional[Dict[str, Any]]:
         """
         Retrieve session state for a specific user conversation.
@@ -233,6 +234,9 @@ class SessionStateService:
         Args:
             user_id: Unique identifier for the user
             conversation_id: Conversation session identifier
+            touch: Record the read as activity and write the state back. The
+                update methods pass False: they store the state themselves, so
+                touching here would serialize and SETEX the whole blob twice.
 
         Returns:
             Session state data or None if not found
@@ -246,7 +250,8 @@ class SessionStateService:
             if session_state:
                 # Update last activity
                 session_state["session_metadata"]["last_activity"] = datetime.now(timezone.utc).isoformat()
-                await self._store_session_state(session_id, session_state)
+                if touch:
+                    await self._store_session_state(session_id, session_state)
 
                 logger.debug(f"Retrieved session state for {session_id}")
                 return session_state
@@ -276,7 +281,7 @@ class SessionStateService:
             True if updated successfully
         """
         try:
-            session_state = await self.get_session_state(user_id, conversation_id)
+            session_state = await self.get_session_state(user_id, conversation_id, touch=False)
 
             if not session_state:
                 logger.warning(f"No session state found for user {user_id}, conversation {conversation_id}")
@@ -330,7 +335,7 @@ class SessionStateService:
             True if updated successfully
         """
         try:
-            session_state = await self.get_session_state(user_id, conversation_id)
+            session_state = await self.get_session_state(user_id, conversation_id, touch=False)
 
             if not session_state:
                 return False
@@ -375,7 +380,7 @@ class SessionStateService:
             True if message added successfully
         """
         try:
-            session_state = await self.get_session_state(user_id, conversation_id)
+            session_state = await self.get_session_state(user_id, conversation_id, touch=False)
 
             if not session_state:
                 # Create session if it doesn't exist
@@ -11,6 +11,7 @@ from celery import shared_task
 import asyncio
 
 from app.core.database import SessionLocal
+from app.core.openai_client import closing_shared_http_client
 from app.schemas.simulation_schemas import GlobalEventCreate, EventType, MoodImpact, ImpactLevel, GlobalEventUpdate
 from app.services.simulation.repository import SimulationRepository
 from app.services.simulation.event_patterns import EventPatterns
@@ -307,7 +308,12 @@ def generate_consciousness_response(self, event_id: str):
                     finally:
                         await db_session.close()
 
-            result = loop.run_until_complete(_generate_consciousness())
+            async def _generate_in_task():
+                # The loop's OpenAI connection pool must close before the loop does
+                async with closing_shared_http_client():
+                    return await _generate_consciousness()
+
+            result = loop.run_until_complete(_generate_in_task())
             return result
 
         finally:
@@ -138,41 +138,60 @@ class SimulationRepository:
     ) -> ClaraGlobalState:
         """Create or update Clara's global state for a trait."""
         try:
-            existing_state = await self.get_clara_global_state(trait_name)
-
-            if existing_state:
-                # Update existing state
-                update_data = state_data.model_dump(exclude_unset=True)
-                if update_data:
-                    await self.db.execute(
-                        update(ClaraGlobalState)
-                        .where(ClaraGlobalState.trait_name == trait_name)
-                        .values(**update_data)
-                    )
+            update_data = state_data.model_dump(exclude_unset=True)
+            if update_data:
+                # Update in place and get the row back in the same statement,
+                # rather than SELECT, UPDATE and SELECT again per trait
+                result = await self.db.execute(
+                    update(ClaraGlobalState)
+                    .where(ClaraGlobalState.trait_name == trait_name)
+                    .values(**update_data)
+                    .returning(ClaraGlobalState)
+                )
+                existing_state = result.scalar_one_or_none()
+                if existing_state:
                     await self.db.commit()
-                return await self.get_clara_global_state(trait_name)
+                    return existing_state
             else:
-                # Create new state
-                if isinstance(state_data, ClaraGlobalStateUpdate):
-                    # Convert update to create data
-                    create_data = ClaraGlobalStateCreate(
-                        trait_name=trait_name,
-                        **state_data.model_dump(exclude_unset=True)
-                    )
-                else:
-                    create_data = state_data
-
-                db_state = ClaraGlobalState(**create_data.model_dump())
-                self.db.add(db_state)
-                await self.db.commit()
-                await self.db.refresh(db_state)
-                return db_state
+                existing_state = await self.get_clara_global_state(trait_name)
+                if existing_state:
+                    return existing_state
+
+            # Create new state
+            if isinstance(state_data, ClaraGlobalStateUpdate):
+                # Convert update to create data
+                create_data = ClaraGlobalStateCreate(
+                    trait_name=trait_name,
+                    **state_data.model_dump(exclude_unset=True)
+                )
+            else:
+                create_data = state_data
+
+            db_state = ClaraGlobalState(**create_data.model_dump())
+            self.db.add(db_state)
+            await self.db.commit()
+            await self.db.refresh(db_state)
+            return db_state
 
         except Exception as e:
             await self.db.rollback()
             logger.error(f"Error creating/updating Clara state for {trait_name}: {e}")
             raise
 
+    async def create_clara_states(self, states: List[ClaraGlobalStateCreate]) -> None:
+        """Insert several trait states in one executemany statement."""
+        if not states:
+            return
+        try:
+            await self.db.execute(
+                insert(ClaraGlobalState), [state.model_dump() for state in states]
+            )
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"Error creating Clara states: {e}")
+            raise
+
     # Simulation Config operations
     async def get_config(self, key: str) -> Optional[SimulationConfig]:
         """Get a configuration setting by key."""
@@ -195,30 +214,23 @@ class SimulationRepository:
         try:
             start_date = datetime.now(timezone.utc) - timedelta(days=days)
 
-            # Total events count
-            total_result = await self.db.execute(
-                select(func.count(GlobalEvents.event_id))
-                .where(GlobalEvents.timestamp >= start_date)
-            )
-            total_events = total_result.scalar() or 0
-
-            # Events by type
-            type_result = await self.db.execute(
-                select(GlobalEvents.event_type, func.count(GlobalEvents.event_id))
+            # One pass over the window: per-type counts with the unprocessed
+            # count alongside, instead of a separate scan for each figure
+            result = await self.db.execute(
+                select(
+                    GlobalEvents.event_type,
+                    func.count(GlobalEvents.event_id),
+                    func.count(GlobalEvents.event_id).filter(
+                        GlobalEvents.status == EventStatus.UNPROCESSED
+                    ),
+                )
                 .where(GlobalEvents.timestamp >= start_date)
                 .group_by(GlobalEvents.event_type)
             )
-            events_by_type = dict(type_result.fetchall())
-
-            # Unprocessed events
-            unprocessed_result = await self.db.execute(
-                select(func.count(GlobalEvents.event_id))
-                .where(and_(
-                    GlobalEvents.timestamp >= start_date,
-                    GlobalEvents.status == EventStatus.UNPROCESSED
-                ))
-            )
-            unprocessed_events = unprocessed_result.scalar() or 0
+            rows = result.fetchall()
+            events_by_type = {event_type: count for event_type, count, _ in rows}
+            total_events = sum(events_by_type.values())
+            unprocessed_events = sum(unprocessed for _, _, unprocessed in rows)
 
             return {
                 "total_events": total_events,
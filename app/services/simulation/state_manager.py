@@ -12,7 +12,7 @@ import asyncio
 import json
 
 from app.core.database import SessionLocal, get_async_session
-from app.schemas.simulation_schemas import ClaraGlobalStateUpdate, TrendDirection
+from app.schemas.simulation_schemas import ClaraGlobalStateCreate, ClaraGlobalStateUpdate, TrendDirection
 from app.services.simulation.repository import SimulationRepository
 from app.models.simulation import GlobalEvents
 from app.models.clara_state import ClaraState
@@ -562,26 +562,29 @@ class StateManagerService:
             async for db_session in get_async_session():
                 try:
                     repo = SimulationRepository(db_session)
-                    initialized_traits = []
 
-                    for trait_name, config in self.core_traits.items():
-                        existing_state = await repo.get_clara_global_state(trait_name)
-
-                        if not existing_state:
-                            from app.schemas.simulation_schemas import ClaraGlobalStateCreate
-                            create_data = ClaraGlobalStateCreate(
-                                trait_name=trait_name,
-                                value=str(config["default"]),
-                                numeric_value=config["default"],
-                                change_reason="Initial default value",
-                                trend=TrendDirection.STABLE,
-                                min_value=config["min"],
-                                max_value=config["max"]
-                            )
-
-                            await repo.create_or_update_clara_state(trait_name, create_data)
-                            initialized_traits.append(trait_name)
-                            logger.info(f"Initialized default state for {trait_name}")
+                    # One read for what exists, one multi-row insert for the rest
+                    existing_traits = {
+                        state.trait_name for state in await repo.get_all_clara_global_states()
+                    }
+                    missing_states = [
+                        ClaraGlobalStateCreate(
+                            trait_name=trait_name,
+                            value=str(config["default"]),
+                            numeric_value=config["default"],
+                            change_reason="Initial default value",
+                            trend=TrendDirection.STABLE,
+                            min_value=config["min"],
+                            max_value=config["max"]
+                        )
+                        for trait_name, config in self.core_traits.items()
+                        if trait_name not in existing_traits
+                    ]
+                    await repo.create_clara_states(missing_states)
+
+                    initialized_traits = [state.trait_name for state in missing_states]
+                    for trait_name in initialized_traits:
+                        logger.info(f"Initialized default state for {trait_name}")
 
                     return {
                         "success": True,
@@ -137,7 +137,6 @@ class SubscriptionManagementService:
         """
         result = db.execute(
             select(UserSubscription)
-            .options(selectinload(UserSubscription.plan))
             .where(
                 and_(
                     UserSubscription.user_id == user_id,
@@ -179,6 +178,7 @@ class SubscriptionManagementService:
             # Get user from database
             result = db.execute(
                 select(User)
+                # Everything the status check reads is loaded up front
                 .options(selectinload(User.subscription).selectinload(UserSubscription.plan))
                 .where(User.id == user_id)
             )
@@ -378,7 +378,6 @@ class SubscriptionManagementService:
         """
         result = db.execute(
             select(UserSubscription)
-            .options(selectinload(UserSubscription.plan))
             .where(UserSubscription.stripe_subscription_id == stripe_subscription_id)
         )
         return result.scalar_one_or_none()
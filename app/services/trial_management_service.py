@@ -3,7 +3,7 @@ import logging
 from typing import List, Optional
 from datetime import datetime, timezone, timedelta
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import select, and_
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -43,6 +43,8 @@ class TrialManagementService:
         
         result = db.execute(
             select(UserSubscription)
+            # Each warning needs the user's email: one IN query for the batch
+            .options(selectinload(UserSubscription.user))
             .where(
                 and_(
                     UserSubscription.status == "trialing",
@@ -252,9 +254,8 @@ class TrialManagementService:
             bool: True if notification was sent successfully
         """
         try:
-            # Get user information
-            result = db.execute(select(User).where(User.id == subscription.user_id))
-            user = result.scalar_one_or_none()
+            # Get user information (eager-loaded with the expiring trials)
+            user = subscription.user
             
             if not user or not user.email:
                 logger.warning(f"Cannot send trial warning: user {subscription.user_id} has no email")
@@ -292,13 +293,13 @@ class TrialManagementService:
         warnings_sent = 0
         
         # Send warnings for trials expiring in 3 days
-        expiring_3_days = await self.get_users_with_expiring_trials(db, days_until_expiry=3)
+        expiring_3_days = self.get_users_with_expiring_trials(db, days_until_expiry=3)
         for subscription in expiring_3_days:
             if await self.send_trial_expiration_warning(db, subscription, 3):
                 warnings_sent += 1
         
         # Send warnings for trials expiring in 1 day
-        expiring_1_day = await self.get_users_with_expiring_trials(db, days_until_expiry=1)
+        expiring_1_day = self.get_users_with_expiring_trials(db, days_until_expiry=1)
         for subscription in expiring_1_day:
             if await self.send_trial_expiration_warning(db, subscription, 1):
                 warnings_sent += 1
@@ -0,0 +1,67 @@
+"""
+get_current_user: loading and first-login creation of the local User row.
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.auth.dependencies import get_current_user
+from app.models.user import User
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # A file database so two sessions see each other's commits
+    engine = create_engine(f"sqlite:///{tmp_path / 'users.db'}")
+    User.__table__.create(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_first_login_creates_user(session_factory):
+    with session_factory() as db:
+        user = await get_current_user({"sub": "auth0|new", "email": "new@example.com"}, db)
+
+        assert user.id is not None
+        assert user.is_anonymous is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_login_reuses_the_other_row(session_factory):
+    token = {"sub": "auth0|race", "email": "race@example.com"}
+    db = session_factory()
+    real_execute = db.execute
+
+    def lookup_then_lose_the_race(*args, **kwargs):
+        # The lookup misses, then another request creates the same user
+        db.execute = real_execute
+        frozen = real_execute(*args, **kwargs).freeze()
+        with session_factory() as other:
+            other.add(User(auth0_sub="auth0|race", email="race@example.com", is_anonymous=False))
+            other.commit()
+        return frozen()
+
+    db.execute = lookup_then_lose_the_race
+    try:
+        user = await get_current_user(token, db)
+    finally:
+        db.close()
+
+    with session_factory() as check:
+        assert check.query(User).filter(User.auth0_sub == "auth0|race").count() == 1
+    assert user.auth0_sub == "auth0|race"
+
+
+@pytest.mark.asyncio
+async def test_email_taken_by_another_account_is_a_conflict(session_factory):
+    with session_factory() as db:
+        db.add(User(auth0_sub="auth0|first", email="shared@example.com", is_anonymous=False))
+        db.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_user({"sub": "auth0|second", "email": "shared@example.com"}, db)
+
+    assert exc_info.value.status_code == 409
@@ -0,0 +1,100 @@
+"""
+Auth0 RS256 verification: JWKS handling and signing-key reuse.
+"""
+
+import asyncio
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from unittest.mock import AsyncMock, patch
+
+from app.auth.auth_utils import AuthUtils
+
+
+@pytest.fixture(scope="module")
+def rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def auth_utils(rsa_key):
+    utils = AuthUtils()
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(rsa_key.public_key()))
+    jwk["kid"] = "test-kid"
+    utils._get_jwks = AsyncMock(return_value={"keys": [jwk]})
+    return utils
+
+
+def _token(rsa_key, utils, **claims):
+    payload = {
+        "sub": "auth0|123",
+        "email": "user@example.com",
+        "aud": utils.audience,
+        "iss": utils.issuer,
+        "exp": int(time.time()) + 60,
+        **claims,
+    }
+    return jwt.encode(payload, rsa_key, algorithm="RS256", headers={"kid": "test-kid"})
+
+
+@pytest.mark.asyncio
+async def test_verify_token_parses_jwk_once(rsa_key, auth_utils):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=_token(rsa_key, auth_utils))
+
+    with patch.object(
+        jwt.algorithms.RSAAlgorithm, "from_jwk", wraps=jwt.algorithms.RSAAlgorithm.from_jwk
+    ) as from_jwk:
+        first = await auth_utils.verify_token(credentials)
+        second = await auth_utils.verify_token(credentials)
+
+    assert first["email"] == second["email"] == "user@example.com"
+    assert from_jwk.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_verify_token_rejects_unknown_kid(rsa_key, auth_utils):
+    token = jwt.encode(
+        {"sub": "x"}, rsa_key, algorithm="RS256", headers={"kid": "other-kid"}
+    )
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await auth_utils.verify_token(credentials)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_concurrent_jwks_misses_share_one_fetch():
+    utils = AuthUtils()
+    calls = 0
+
+    async def slow_fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        utils.jwks_cache = {"keys": []}
+        return utils.jwks_cache
+
+    utils._fetch_jwks = slow_fetch
+    results = await asyncio.gather(*(utils._get_jwks() for _ in range(5)))
+
+    assert calls == 1
+    assert all(r == {"keys": []} for r in results)
+    assert utils._jwks_inflight is None
+
+
+@pytest.mark.asyncio
+async def test_failed_jwks_fetch_is_retried_by_next_caller():
+    utils = AuthUtils()
+    utils._fetch_jwks = AsyncMock(side_effect=HTTPException(status_code=503))
+
+    with pytest.raises(HTTPException):
+        await utils._get_jwks()
+
+    utils._fetch_jwks = AsyncMock(return_value={"keys": []})
+    assert await utils._get_jwks() == {"keys": []}
@@ -0,0 +1,68 @@
+"""
+BackgroundTaskManager: stop() wakes the hourly wait instead of cancelling the
+loop; the maintenance job stubs open their sessions cleanly.
+"""
+
+import asyncio
+import logging
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.services.background_tasks import (
+    BackgroundTaskManager,
+    cleanup_expired_sessions,
+    send_subscription_reminders,
+)
+
+
+@pytest.mark.asyncio
+async def test_stop_wakes_the_loop_without_cancelling_it():
+    manager = BackgroundTaskManager()
+    manager._process_trial_management = AsyncMock()
+
+    await manager.start()
+    await asyncio.sleep(0)  # let the loop run its first pass and start waiting
+    await asyncio.wait_for(manager.stop(), timeout=1)
+
+    assert manager._process_trial_management.await_count == 1
+    assert manager.task.done() and not manager.task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_manager_can_restart_after_stop():
+    manager = BackgroundTaskManager()
+    manager._process_trial_management = AsyncMock()
+
+    await manager.start()
+    await manager.stop()
+    await manager.start()
+    await asyncio.sleep(0)
+
+    assert not manager.task.done()
+    await manager.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("job", [cleanup_expired_sessions, send_subscription_reminders])
+async def test_maintenance_jobs_open_a_session_without_errors(job, caplog):
+    # Both jobs swallow exceptions, so a broken session factory only shows in the log
+    with caplog.at_level(logging.ERROR, logger="app.services.background_tasks"):
+        await job()
+
+    assert caplog.records == []
+
+
+
+@pytest.mark.asyncio
+async def test_failed_run_is_logged_and_the_loop_keeps_going(caplog):
+    manager = BackgroundTaskManager()
+    manager._process_trial_management = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with caplog.at_level(logging.ERROR, logger="app.services.background_tasks"):
+        await manager.start()
+        await asyncio.sleep(0)
+        await asyncio.wait_for(manager.stop(), timeout=1)
+
+    assert not manager.task.cancelled() and manager.task.exception() is None
+    assert any("db down" in r.getMessage() for r in caplog.records)
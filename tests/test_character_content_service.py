@@ -1,6 +1,7 @@
 """
 Tests for CharacterContentService content loading.
 """
+import os
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -9,6 +10,14 @@ from app.core.conversation_config import ConversationContextConfig
 from app.services.character_content_service import CharacterContentService
 
 
+@pytest.fixture(autouse=True)
+def clear_file_cache():
+    """The content caches are class-level; keep mocked reads from leaking between tests"""
+    CharacterContentService.reload()
+    yield
+    CharacterContentService.reload()
+
+
 @pytest.fixture
 def content_service():
     """Create CharacterContentService instance for testing"""
@@ -72,6 +81,25 @@ class TestCharacterContentService:
         assert first == second == "cached content"
         assert mock_read.call_count == 1
 
+    def test_load_cache_is_shared_and_invalidated_by_mtime(self, tmp_path):
+        """A new instance reuses the cached read until the file's mtime changes"""
+        path = tmp_path / "clara-character-gist.md"
+        path.write_text("first", encoding="utf-8")
+        first_service = CharacterContentService()
+        first_service.content_base_path = tmp_path
+        assert first_service.load("character_gist") == "first"
+
+        # Same mtime: a fresh instance is served from the cache, not the disk
+        mtime_ns = path.stat().st_mtime_ns
+        path.write_text("second", encoding="utf-8")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        second_service = CharacterContentService()
+        second_service.content_base_path = tmp_path
+        assert second_service.load("character_gist") == "first"
+
+        os.utime(path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+        assert second_service.load("character_gist") == "second"
+
     def test_get_consolidated_backstory(self, content_service):
         """Test consolidated backstory construction"""
         content = {
@@ -97,6 +125,18 @@ class TestCharacterContentService:
         sections = result.split("\n\n")
         assert len(sections) == 4  # 4 non-empty sections
 
+    def test_consolidated_backstory_is_rebuilt_only_when_a_section_changes(self, content_service):
+        """Unchanged sections hand back the same consolidated string"""
+        content = {"character_gist": "Gist content", "friend_character": "Friend content"}
+        with patch.object(content_service, "load", side_effect=lambda t: content.get(t, "")):
+            first = content_service.get_consolidated_backstory()
+            second = content_service.get_consolidated_backstory()
+            content["friend_character"] = "New friend content"
+            third = content_service.get_consolidated_backstory()
+
+        assert second is first
+        assert "New friend content" in third
+
     def test_get_consolidated_backstory_all_empty(self, content_service):
         """Test consolidated backstory when all content is empty"""
         with patch.object(content_service, "load", return_value=""):
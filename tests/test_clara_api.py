@@ -10,7 +10,7 @@ from app.main import app as fastapi_app
 from app.core.database import Base, get_db
 from app.models.clara_state import ClaraState
 # Import all models to ensure they're registered with Base
-import app.models
+import app.models._all
 
 
 class TestClaraAPI:
@@ -1,5 +1,6 @@
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 
@@ -108,4 +109,22 @@ class TestClaraState:
         with pytest.raises(Exception):
             state = ClaraState(trait_name="test")
             db_session.add(state)
-            db_session.commit()
\ No newline at end of file
+            db_session.commit()
+
+    def test_numeric_value_must_respect_bounds(self, db_session):
+        """Test that the database rejects a numeric_value outside min/max"""
+        db_session.add(ClaraState(trait_name="mood", value="5", numeric_value=5.0, min_value=0.0, max_value=10.0))
+        db_session.commit()
+
+        db_session.add(ClaraState(trait_name="stress", value="11", numeric_value=11.0, min_value=0.0, max_value=10.0))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
+
+    def test_trend_must_be_a_known_direction(self, db_session):
+        """Test that the database rejects an unknown trend"""
+        db_session.add(ClaraState(trait_name="mood", value="5", trend="stable"))
+        db_session.commit()
+
+        db_session.add(ClaraState(trait_name="energy", value="5", trend="sideways"))
+        with pytest.raises(IntegrityError):
+            db_session.commit()
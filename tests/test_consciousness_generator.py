@@ -3,8 +3,10 @@ Tests for consciousness generator service and integration.
 """
 import pytest
 import asyncio
+import httpx
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
+from openai import APITimeoutError, RateLimitError
 
 from app.services.consciousness_generator_service import ConsciousnessGeneratorService, ConsciousnessResponse
 from app.models.simulation import GlobalEvents
@@ -77,15 +79,124 @@ class TestConsciousnessGeneratorService:
         """Test consciousness response when API times out."""
 
         with patch.object(consciousness_service.state_manager, 'get_current_global_state', return_value=mock_state_context):
-            with patch('asyncio.wait_for', side_effect=asyncio.TimeoutError("API timeout")):
+            with patch.object(
+                consciousness_service, '_make_consciousness_call',
+                side_effect=APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")),
+            ):
                 result = await consciousness_service.generate_consciousness_response(mock_event, timeout=1)
 
         assert result.success is False
-        assert result.error_message == "API timeout"
+        assert result.error_message.startswith("API timeout (")
         assert "work situation" in result.emotional_reaction  # Should use fallback
         assert len(result.chosen_action) > 0
         assert len(result.internal_thoughts) > 0
 
+    @pytest.mark.asyncio
+    async def test_rate_limited_call_is_retried_within_budget(self, consciousness_service):
+        """A 429 is retried after a jittered backoff instead of failing the event."""
+
+        rate_limited = RateLimitError(
+            "429 rate limited",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions")),
+            body=None,
+        )
+        ok = Mock(usage=None)
+        client = Mock()
+        client.with_options.return_value.chat.completions.create = AsyncMock(side_effect=[rate_limited, ok])
+        consciousness_service.client = client
+
+        with patch("app.services.consciousness_generator_service.asyncio.sleep", new=AsyncMock()) as sleep:
+            response = await consciousness_service._make_consciousness_call("prompt", timeout=10)
+
+        assert response is ok
+        assert sleep.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_not_serialized(self, consciousness_service):
+        """No rate gate spaces calls out: concurrent calls overlap."""
+
+        in_flight = peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(usage=None)
+
+        client = Mock()
+        client.with_options.return_value.chat.completions.create = create
+        consciousness_service.client = client
+
+        await asyncio.gather(*(consciousness_service._make_consciousness_call("prompt", timeout=10) for _ in range(4)))
+
+        assert peak == 4
+
+    @pytest.mark.asyncio
+    async def test_unusable_default_model_response_is_retried_on_premium(self, consciousness_service, mock_event, mock_state_context):
+        """Ordinary events use the cheaper model and only upgrade when its output is unusable."""
+
+        bad, good = Mock(), Mock()
+        bad.choices = [Mock()]
+        bad.choices[0].message.content = "not json"
+        good.choices = [Mock()]
+        good.choices[0].message.content = (
+            '{"emotional_reaction": "Frustrated.", "chosen_action": "Push back politely.", '
+            '"internal_thoughts": "Why is everything always urgent?"}'
+        )
+        # The config is shared; an earlier timeout test may have left it degraded
+        consciousness_service.consciousness_config.disable_fallback_mode()
+
+        with patch.object(consciousness_service.state_manager, 'get_current_global_state', return_value=mock_state_context):
+            with patch.object(consciousness_service, '_make_consciousness_call', side_effect=[bad, good]) as call:
+                result = await consciousness_service.generate_consciousness_response(mock_event, timeout=10)
+
+        assert result.success is True
+        assert [c.args[2] for c in call.call_args_list] == ["gpt-4o-mini", "gpt-4o"]
+
+    @pytest.mark.asyncio
+    async def test_failed_premium_retry_keeps_first_response(self, consciousness_service, mock_event, mock_state_context):
+        """A parsed but out-of-character reply survives a timed-out upgrade, without tripping fallback mode."""
+
+        out_of_character = Mock()
+        out_of_character.choices = [Mock()]
+        out_of_character.choices[0].message.content = (
+            '{"emotional_reaction": "As an AI, I feel nothing.", "chosen_action": "Carry on.", '
+            '"internal_thoughts": "Another meeting."}'
+        )
+        timeout_error = APITimeoutError(request=httpx.Request("POST", "https://api.openai.com/v1/chat/completions"))
+        consciousness_service.consciousness_config.disable_fallback_mode()
+
+        with patch.object(consciousness_service.state_manager, 'get_current_global_state', return_value=mock_state_context):
+            with patch.object(consciousness_service, '_make_consciousness_call', side_effect=[out_of_character, timeout_error]) as call:
+                result = await consciousness_service.generate_consciousness_response(mock_event, timeout=10)
+
+        assert call.call_count == 2
+        assert result.success is True
+        assert result.in_character is False
+        assert result.chosen_action == "Carry on."
+        assert consciousness_service.consciousness_config.fallback_mode_active is False
+
+    @pytest.mark.asyncio
+    async def test_no_premium_retry_without_budget(self, consciousness_service, mock_event, mock_state_context):
+        bad = Mock()
+        bad.choices = [Mock()]
+        bad.choices[0].message.content = "not json"
+        consciousness_service.consciousness_config.disable_fallback_mode()
+
+        with patch.object(consciousness_service.state_manager, 'get_current_global_state', return_value=mock_state_context):
+            with patch.object(consciousness_service, '_make_consciousness_call', return_value=bad) as call:
+                result = await consciousness_service.generate_consciousness_response(mock_event, timeout=1)
+
+        assert call.call_count == 1
+        assert result.success is False
+
+    def test_high_intensity_events_use_premium_model(self, consciousness_service, mock_event):
+        assert consciousness_service._select_model(mock_event) == "gpt-4o-mini"
+        mock_event.intensity = 9
+        assert consciousness_service._select_model(mock_event) == "gpt-4o"
+
     @pytest.mark.asyncio
     async def test_generate_consciousness_response_no_api_key(self, mock_event, mock_state_context):
         """Test consciousness response when no API key is available."""
@@ -222,6 +333,34 @@ class TestConsciousnessGeneratorService:
         assert result.chosen_action == "I need to prioritize my tasks and ask for help if needed."
         assert result.internal_thoughts == "I can't keep pushing myself this hard without consequences."
 
+    def test_parse_consciousness_response_null_reasoning_steps(self, consciousness_service, mock_event):
+        """The strict schema lets basic-mode replies send reasoning_steps as null."""
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = (
+            '{"reasoning_steps": null, "emotional_reaction": "Tired.", '
+            '"chosen_action": "Go to bed early.", "internal_thoughts": "Tomorrow will be better."}'
+        )
+
+        result = consciousness_service._parse_consciousness_response(mock_response, mock_event)
+
+        assert result.success is True
+        assert result.chosen_action == "Go to bed early."
+
+    def test_parse_consciousness_response_refusal(self, consciousness_service, mock_event):
+        """Strict mode reports refusals with no content; that gets a named fallback error."""
+
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = None
+        mock_response.choices[0].message.refusal = "I can't help with that."
+
+        result = consciousness_service._parse_consciousness_response(mock_response, mock_event)
+
+        assert result.success is False
+        assert result.error_message == "Model refused"
+
     @pytest.mark.asyncio
     async def test_parse_consciousness_response_invalid_json(self, consciousness_service, mock_event):
         """Test parsing invalid JSON response falls back gracefully."""
@@ -110,3 +110,10 @@ def test_conversation_log_endpoint_returns_current_user_rows():
     finally:
         fastapi_app.dependency_overrides.clear()
         db.close()
+
+
+def test_orm_select_leaves_embedding_out():
+    """The embedding is only read by raw-SQL vector search; ORM loads skip it."""
+    compiled = str(select(ConversationLog).compile())
+    assert "conversation_log.content" in compiled
+    assert "conversation_log.embedding" not in compiled
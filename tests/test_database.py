@@ -0,0 +1,49 @@
+"""
+Dev SQLite bootstrap: column patching and the schema-fingerprint gate.
+"""
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+import app.core.database as database
+
+
+def _sqlite_engine(monkeypatch):
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database.settings, "database_url", "sqlite:///dev.db")
+    return engine
+
+
+def test_ensure_dev_sqlite_columns_adds_only_missing(monkeypatch):
+    engine = _sqlite_engine(monkeypatch)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+
+    database.ensure_dev_sqlite_columns()
+    database.ensure_dev_sqlite_columns()
+
+    with engine.connect() as conn:
+        assert database._sqlite_table_columns(conn, "users") == {"id", "anon_uuid"}
+
+
+def test_bootstrap_dev_schema_skips_when_fingerprint_matches(monkeypatch):
+    engine = _sqlite_engine(monkeypatch)
+    calls = []
+    monkeypatch.setattr(database, "create_tables", lambda: calls.append("create"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY)"))
+
+    database.bootstrap_dev_schema()
+    database.bootstrap_dev_schema()
+    assert calls == ["create"]
+
+    # A schema change in code invalidates the stored fingerprint
+    monkeypatch.setattr(database, "_DEV_SQLITE_COLUMNS", {"users": (("nickname", "VARCHAR"),)})
+    database.bootstrap_dev_schema()
+    assert calls == ["create", "create"]
+    with engine.connect() as conn:
+        assert "nickname" in database._sqlite_table_columns(conn, "users")
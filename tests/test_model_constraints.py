@@ -0,0 +1,36 @@
+"""
+Enum-like columns are VARCHARs with CHECK IN (...) constraints; the allowed
+values must stay in step with the schema enums the API validates against.
+"""
+
+import re
+
+import pytest
+
+from app.core.database import Base
+from app.models import _all  # noqa: F401
+from app.schemas.journal_schemas import JournalStatus
+from app.schemas.simulation_schemas import EventStatus, EventType, ImpactLevel, MoodImpact, TrendDirection
+
+
+def _check_values(table_name: str, constraint_name: str) -> set:
+    table = Base.metadata.tables[table_name]
+    (constraint,) = [c for c in table.constraints if c.name == constraint_name]
+    return set(re.findall(r"'([^']*)'", str(constraint.sqltext)))
+
+
+@pytest.mark.parametrize(
+    "table_name, constraint_name, enum",
+    [
+        ("journal_entries", "ck_journal_entries_status", JournalStatus),
+        ("global_events", "ck_global_events_event_type", EventType),
+        ("global_events", "ck_global_events_status", EventStatus),
+        ("global_events", "ck_global_events_impact_mood", MoodImpact),
+        ("global_events", "ck_global_events_impact_energy", ImpactLevel),
+        ("global_events", "ck_global_events_impact_stress", ImpactLevel),
+        ("clara_state", "ck_clara_state_trend", TrendDirection),
+        ("clara_global_state", "ck_clara_global_state_trend", TrendDirection),
+    ],
+)
+def test_check_constraint_matches_schema_enum(table_name, constraint_name, enum):
+    assert _check_values(table_name, constraint_name) == {member.value for member in enum}
@@ -0,0 +1,45 @@
+"""
+Schema lint over the model metadata and mapper configuration.
+"""
+
+from sqlalchemy import create_engine, select
+
+from app.core.database import Base
+from app.models import _all  # noqa: F401
+from app.models.simulation import GlobalEvents
+
+
+def test_no_index_duplicates_a_primary_key():
+    # primary_key=True already gets an index; index=True on the same column
+    # adds a second one that every insert has to maintain
+    duplicates = [
+        index.name
+        for table in Base.metadata.tables.values()
+        for index in table.indexes
+        if [c.name for c in index.columns] == [c.name for c in table.primary_key.columns]
+    ]
+    assert duplicates == []
+
+
+def test_all_mappers_configure():
+    # Startup configures the registry eagerly; every string relationship
+    # target has to resolve once all model modules are imported
+    Base.registry.configure()
+    assert all(mapper.configured for mapper in Base.registry.mappers)
+
+
+def test_unprocessed_event_queue_uses_partial_index():
+    engine = create_engine("sqlite://")
+    GlobalEvents.__table__.create(engine)
+    query = (
+        select(GlobalEvents)
+        .where(GlobalEvents.status == "unprocessed")
+        .order_by(GlobalEvents.timestamp)
+        .limit(10)
+    )
+    compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+    with engine.connect() as conn:
+        plan = " ".join(str(row) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}"))
+
+    assert "ix_global_events_unprocessed_timestamp" in plan
+    assert "TEMP B-TREE" not in plan
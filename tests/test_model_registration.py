@@ -0,0 +1,20 @@
+"""
+app.models loads lazily, so a process may import a single model module; the
+mappers must still configure whichever module comes first.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+MODULES = ["clara_state", "conversation_log", "journal", "simulation", "subscription", "user"]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_single_model_import_configures_mappers(module):
+    # A fresh interpreter: the test session has long since imported everything
+    code = f"import app.models.{module}; from sqlalchemy.orm import configure_mappers; configure_mappers()"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
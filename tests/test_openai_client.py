@@ -0,0 +1,45 @@
+"""
+Shared AsyncOpenAI connection pool: one per event loop.
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.openai_client import (
+    aclose_shared_http_client,
+    closing_shared_http_client,
+    shared_http_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_same_loop_reuses_one_pool():
+    first = shared_http_client()
+    assert shared_http_client() is first
+
+    await aclose_shared_http_client()
+    assert first.is_closed
+    assert shared_http_client() is not first
+    await aclose_shared_http_client()
+
+
+def test_each_loop_gets_its_own_pool():
+    async def grab():
+        client = shared_http_client()
+        await aclose_shared_http_client()
+        return client
+
+    assert asyncio.run(grab()) is not asyncio.run(grab())
+
+
+def test_no_pool_outside_a_loop():
+    assert shared_http_client() is None
+
+
+def test_task_scope_closes_its_loops_pool():
+    async def task():
+        async with closing_shared_http_client():
+            return shared_http_client()
+
+    assert asyncio.run(task()).is_closed
@@ -371,4 +371,22 @@ class TestSessionStateService:
 
         # Verify interaction count was incremented
         stored_state = session_service._store_session_state.call_args[0][1]
-        assert stored_state['session_metadata']['total_interactions'] == 6
\ No newline at end of file
+        assert stored_state['session_metadata']['total_interactions'] == 6
+
+    @pytest.mark.asyncio
+    async def test_update_stores_session_state_once(self, session_service):
+        """Test that an update writes the state back once, activity included."""
+        session_service._get_session_state = AsyncMock(return_value={
+            'session_id': 'user123:conv456',
+            'session_adjustments': {},
+            'session_metadata': {'total_interactions': 0, 'last_activity': '2024-01-01T10:00:00Z'}
+        })
+        session_service._store_session_state = AsyncMock(return_value=True)
+
+        await session_service.update_session_adjustments(
+            'user123', 'conv456', {'mood': {'value': 2}}
+        )
+
+        assert session_service._store_session_state.call_count == 1
+        stored_state = session_service._store_session_state.call_args[0][1]
+        assert stored_state['session_metadata']['last_activity'] != '2024-01-01T10:00:00Z'
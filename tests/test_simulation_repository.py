@@ -0,0 +1,134 @@
+"""
+SimulationRepository against a real (SQLite) database: trait state writes and
+event statistics.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.pool import StaticPool
+
+from app.models.simulation import ClaraGlobalState, GlobalEvents
+from app.schemas.simulation_schemas import ClaraGlobalStateCreate, ClaraGlobalStateUpdate, TrendDirection
+from app.services.simulation.repository import SimulationRepository
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(ClaraGlobalState.__table__.create)
+    maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_clara_state_updates_in_one_statement(session):
+    repo = SimulationRepository(session)
+    await repo.create_or_update_clara_state("mood", ClaraGlobalStateCreate(
+        trait_name="mood", value="60", numeric_value=60,
+        trend=TrendDirection.STABLE, min_value=0, max_value=100,
+    ))
+    # The state manager reads the trait before updating it, so the row is
+    # already in the identity map; the update must still hand back new values
+    await repo.get_clara_global_state("mood")
+
+    statements = []
+    sync_engine = session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        updated = await repo.create_or_update_clara_state("mood", ClaraGlobalStateUpdate(
+            value="65", numeric_value=65, trend=TrendDirection.INCREASING,
+        ))
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert updated.numeric_value == 65
+    assert updated.trend == "increasing"
+    assert len(statements) == 1
+    assert statements[0].lstrip().upper().startswith("UPDATE")
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_clara_state_creates_missing_trait(session):
+    repo = SimulationRepository(session)
+
+    created = await repo.create_or_update_clara_state("energy", ClaraGlobalStateUpdate(
+        value="70", numeric_value=70,
+    ))
+
+    assert created.state_id is not None
+    assert (await repo.get_clara_global_state("energy")).numeric_value == 70
+
+
+@pytest.mark.asyncio
+async def test_get_event_statistics_in_one_query(session):
+    await session.run_sync(lambda s: GlobalEvents.__table__.create(s.connection()))
+    now = datetime.now(timezone.utc)
+    # Core insert: another test module patches GlobalEvents.__new__
+    await session.execute(insert(GlobalEvents.__table__), [
+        {"event_id": "1", "event_type": "work", "summary": "standup", "timestamp": now, "status": "processed"},
+        {"event_id": "2", "event_type": "work", "summary": "deadline", "timestamp": now, "status": "unprocessed"},
+        {"event_id": "3", "event_type": "social", "summary": "lunch", "timestamp": now, "status": "unprocessed"},
+        {"event_id": "4", "event_type": "social", "summary": "old", "status": "unprocessed",
+         "timestamp": now - timedelta(days=30)},
+    ])
+    await session.commit()
+
+    statements = []
+    sync_engine = session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        stats = await SimulationRepository(session).get_event_statistics(7)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert stats["total_events"] == 3
+    assert stats["events_by_type"] == {"work": 2, "social": 1}
+    assert stats["unprocessed_events"] == 2
+    assert len(statements) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_clara_states_inserts_in_one_statement(session):
+    repo = SimulationRepository(session)
+    states = [
+        ClaraGlobalStateCreate(trait_name=name, value="50", numeric_value=50, trend=TrendDirection.STABLE)
+        for name in ("mood", "energy", "stress")
+    ]
+
+    statements = []
+    sync_engine = session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(sync_engine, "before_cursor_execute", listener)
+    try:
+        await repo.create_clara_states(states)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert [s.trait_name for s in await repo.get_all_clara_global_states()] == ["energy", "mood", "stress"]
+
+
+@pytest.mark.asyncio
+async def test_new_events_get_status_and_creator_from_server_defaults(session):
+    await session.run_sync(lambda s: GlobalEvents.__table__.create(s.connection()))
+    await session.execute(insert(GlobalEvents.__table__).values(
+        event_id="1", event_type="work", summary="standup",
+    ))
+    await session.commit()
+
+    stored = await SimulationRepository(session).get_global_event("1")
+
+    assert stored.status == "unprocessed"
+    assert stored.created_by == "simulation_engine"
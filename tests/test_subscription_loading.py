@@ -0,0 +1,142 @@
+"""
+Loader strategies on the subscription models: the status check must not issue
+per-row SELECTs for relationships it reads.
+
+The ``db`` fixture forbids SQL-emitting lazy loads, the test-side equivalent of
+``raiseload("*")`` that still honours eager defaults declared on the mappers
+(``UserSubscription.plan`` is ``lazy="selectin"``). Code under test has to load
+what it reads up front, e.g. with ``selectinload(User.subscription)``; touching
+an unloaded relationship raises InvalidRequestError instead of quietly adding
+a SELECT per row.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database import Base
+from app.models import _all  # noqa: F401
+from app.models.subscription import SubscriptionPlan, UserSubscription
+from app.models.user import User
+from app.services.subscription_management_service import SubscriptionManagementService
+from app.services.trial_management_service import TrialManagementService
+
+
+@contextmanager
+def count_queries(engine):
+    """Collect every SQL statement executed on ``engine`` inside the block."""
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def forbid_lazy_loads(session):
+    """Make any lazy load that would emit SQL on ``session`` raise."""
+
+    @event.listens_for(session, "do_orm_execute")
+    def _raise_on_lazy_load(orm_execute_state):
+        if orm_execute_state.lazy_loaded_from is not None:
+            raise InvalidRequestError(
+                f"Lazy load from {orm_execute_state.lazy_loaded_from.class_.__name__} "
+                "is not allowed; add a loader option to the query"
+            )
+
+    return session
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://", poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine)()
+    for i in range(3):
+        # One plan per subscription, so a per-row lazy load would show up as N+1
+        plan = SubscriptionPlan(
+            name=f"Plan {i}", price_cents=999, interval="month", stripe_price_id=f"price_{i}"
+        )
+        user = User(auth0_sub=f"auth0|{i}", email=f"u{i}@example.com")
+        session.add_all([plan, user])
+        session.flush()
+        # No period/trial dates: SQLite hands them back naive, and the status
+        # check compares them against an aware now()
+        session.add(UserSubscription(user_id=user.id, plan_id=plan.id, status="active"))
+    session.commit()
+    session.expunge_all()
+    yield forbid_lazy_loads(session)
+    session.close()
+
+
+def test_status_check_loads_subscription_and_plan_without_lazy_selects(engine, db):
+    service = SubscriptionManagementService()
+    user_id = db.query(User.id).filter(User.auth0_sub == "auth0|0").scalar()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        status = service.check_user_subscription_status(db, user_id)
+
+    assert status.plan_name == "Plan 0"
+    # user, its subscription, the subscription's plan
+    assert len(queries) <= 3
+
+
+def test_listing_subscriptions_loads_plans_in_one_query(engine, db):
+    with count_queries(engine) as queries:
+        subscriptions = db.query(UserSubscription).all()
+        names = {s.plan.name for s in subscriptions}
+
+    assert names == {"Plan 0", "Plan 1", "Plan 2"}
+    assert len(subscriptions) == 3
+    assert len(queries) == 2
+
+
+def test_unloaded_relationship_access_raises(db):
+    subscription = db.query(UserSubscription).first()
+
+    with pytest.raises(InvalidRequestError):
+        subscription.payment_records
+
+    # Opting in with a loader option makes the same access legal
+    db.expunge_all()
+    subscription = (
+        db.query(UserSubscription)
+        .options(selectinload(UserSubscription.payment_records))
+        .first()
+    )
+    assert subscription.payment_records == []
+
+
+@pytest.mark.asyncio
+async def test_trial_warnings_load_users_with_the_batch(engine, db):
+    for subscription in db.query(UserSubscription).all():
+        subscription.status = "trialing"
+        subscription.trial_end = datetime.now(timezone.utc) + timedelta(days=2)
+    db.commit()
+    db.expunge_all()
+
+    with count_queries(engine) as queries:
+        sent = await TrialManagementService().process_trial_expiration_warnings(db)
+
+    assert sent == 3
+    # 3-day window: subscriptions, their plans, their users; 1-day window: empty
+    assert len(queries) == 4
@@ -375,3 +375,38 @@ async def test_get_subscription_status_does_not_await_sync_service(mock_db, samp
 
     assert result is expected
     mock_service.check_user_subscription_status.assert_called_once_with(mock_db, sample_user.id)
+
+
+def test_subscription_required_response_is_formatted_by_handler():
+    """402s from the guard get the enriched body; other errors keep FastAPI's shape."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from starlette.exceptions import HTTPException as StarletteHTTPException
+    from app.middleware.subscription_middleware import handle_subscription_error
+
+    app = FastAPI()
+    app.add_exception_handler(StarletteHTTPException, handle_subscription_error)
+
+    @app.get("/gated")
+    async def gated():
+        raise HTTPException(
+            status_code=status.HTTP_402_PAYMENT_REQUIRED,
+            detail="Subscribe please",
+            headers={"X-Subscription-Required": "true"},
+        )
+
+    client = TestClient(app)
+
+    response = client.get("/gated")
+    assert response.status_code == 402
+    assert response.headers["X-Subscription-Required"] == "true"
+    body = response.json()
+    assert body["error"] == "subscription_required"
+    assert body["detail"] == body["message"] == "Subscribe please"
+    assert body["path"] == "/gated"
+    stamp = datetime.strptime(body["timestamp"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+    assert abs((datetime.now(timezone.utc) - stamp).total_seconds()) < 2
+
+    missing = client.get("/nope")
+    assert missing.status_code == 404
+    assert missing.json() == {"detail": "Not Found"}